@@ -27,7 +27,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.base_scraper import BaseScraper
 from shared.constants import SourceId
 from shared.models import JobListing
-from shared.utils import get_iso_timestamp
+from shared.utils import compile_title_filter, get_iso_timestamp
 
 from .config import (
     BASE_URL,
@@ -50,6 +50,8 @@ from .api_client import fetch_job_details, get_apply_url, JobDetailsFetchError
 
 logger = logging.getLogger(__name__)
 
+_should_include_job = compile_title_filter(INCLUDE_TITLE_KEYWORDS, EXCLUDE_TITLE_KEYWORDS)
+
 
 class AppleJobsScraper(BaseScraper):
     """Main scraper class for Apple Careers (extends BaseScraper)"""
@@ -137,14 +139,7 @@ class AppleJobsScraper(BaseScraper):
 
     def filter_job(self, job_title: str) -> bool:
         """Filter job by title keywords using include/exclude keyword lists"""
-        title_lower = job_title.lower()
-
-        # Check for exclusion keywords first
-        if any(kw.lower() in title_lower for kw in EXCLUDE_TITLE_KEYWORDS):
-            return False
-
-        # Check for inclusion keywords
-        return any(kw.lower() in title_lower for kw in INCLUDE_TITLE_KEYWORDS)
+        return _should_include_job(job_title)
 
     async def scrape_query(
         self, search_query: str, max_jobs: Optional[int] = None
@@ -13,6 +13,7 @@ from playwright.async_api import Page
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.base_scraper import BaseScraper
 from shared.constants import SourceId
+from shared.utils import compile_title_filter
 
 from .config import (
     BASE_URL,
@@ -28,7 +29,6 @@ from .utils import (
     random_delay,
     get_iso_timestamp,
     extract_job_id_from_url,
-    should_include_job,
 )
 from .parser import (
     extract_job_cards_from_list,
@@ -38,6 +38,8 @@ from .parser import (
 
 logger = logging.getLogger(__name__)
 
+_should_include_job = compile_title_filter(INCLUDE_TITLE_KEYWORDS, EXCLUDE_TITLE_KEYWORDS)
+
 
 class GoogleJobsScraper(BaseScraper):
     """Main scraper class for Google Careers (extends BaseScraper)"""
@@ -80,7 +82,7 @@ class GoogleJobsScraper(BaseScraper):
 
     def filter_job(self, job_title: str) -> bool:
         """Filter job by title keywords"""
-        return should_include_job(job_title, INCLUDE_TITLE_KEYWORDS, EXCLUDE_TITLE_KEYWORDS)
+        return _should_include_job(job_title)
 
     # ========== Google-Specific Methods ==========
 
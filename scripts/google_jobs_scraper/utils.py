@@ -6,6 +6,7 @@ import asyncio
 import random
 import json
 import logging
+import re
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -30,6 +31,9 @@ from .models import CheckpointData
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Job ID is everything between /jobs/results/ and the first hyphen
+_JOB_ID_RE = re.compile(r"/jobs/results/([^-]*)")
+
 
 async def random_delay():
     """Add random delay between requests to avoid detection"""
@@ -113,33 +117,8 @@ def extract_job_id_from_url(url: str) -> Optional[str]:
     Example: "jobs/results/74939955737961158-software-engineer-iii-google-cloud"
     Returns: "74939955737961158"
     """
-    try:
-        if "/jobs/results/" in url:
-            # Extract the part after /jobs/results/
-            job_part = url.split("/jobs/results/")[1]
-            # Job ID is everything before the first hyphen
-            job_id = job_part.split("-")[0]
-            return job_id
-        return None
-    except Exception as e:
-        logger.warning(f"Could not extract job ID from URL {url}: {e}")
-        return None
-
-
-def should_include_job(title: str, include_keywords: list, exclude_keywords: list) -> bool:
-    """
-    Check if a job title should be included based on keyword filters
-    """
-    title_lower = title.lower()
-
-    # Check for exclusion keywords first
-    has_exclude = any(kw.lower() in title_lower for kw in exclude_keywords)
-    if has_exclude:
-        return False
-
-    # Check for inclusion keywords
-    has_include = any(kw.lower() in title_lower for kw in include_keywords)
-    return has_include
+    match = _JOB_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def ensure_output_directory(output_path: str):
@@ -23,6 +23,7 @@ from .api_client import (
     get_apply_url,
     JobSearchError,
     JobDetailsFetchError,
+    JobDetailsTransientError,
 )
 from .parser import (
     extract_job_cards_from_list,
@@ -50,6 +51,7 @@ __all__ = [
     "get_apply_url",
     "JobSearchError",
     "JobDetailsFetchError",
+    "JobDetailsTransientError",
     # Parser
     "extract_job_cards_from_list",
     "extract_position_id_from_url",
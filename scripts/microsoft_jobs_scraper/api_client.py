@@ -55,6 +55,27 @@ class JobDetailsFetchError(Exception):
     pass
 
 
+class JobDetailsTransientError(JobDetailsFetchError):
+    """Detail fetch failure worth retrying: timeout, HTTP 5xx or 429"""
+    pass
+
+
+# _FETCH_JS throws `HTTP <status>` for non-ok responses and an AbortError
+# when its own timeout fires.
+_HTTP_STATUS_RE = re.compile(r"HTTP (\d{3})")
+
+
+def _is_transient_fetch_error(message: str) -> bool:
+    """True for in-page timeouts and 5xx/429 statuses; 4xx blocks and parse errors are not."""
+    if "AbortError" in message:
+        return True
+    match = _HTTP_STATUS_RE.search(message)
+    if not match:
+        return False
+    status = int(match.group(1))
+    return status == 429 or status >= 500
+
+
 def _format_location(loc: Any) -> str:
     """
     Format location from various API response formats into a string.
@@ -244,7 +265,8 @@ async def fetch_job_details(page: Page, position_id: str) -> Dict[str, Any]:
         Dictionary with detailed job information
 
     Raises:
-        JobDetailsFetchError: If the API request fails
+        JobDetailsTransientError: On timeout, HTTP 5xx or 429 (safe to retry)
+        JobDetailsFetchError: On any other failure (4xx, network, parse)
     """
     api_url = (
         f"{BASE_URL}{API_BASE}/position_details"
@@ -272,12 +294,15 @@ async def fetch_job_details(page: Page, position_id: str) -> Dict[str, Any]:
             "Detail fetch outer timeout for job %s after %.0fs",
             position_id, _FETCH_OUTER_TIMEOUT_S,
         )
-        raise JobDetailsFetchError(
+        raise JobDetailsTransientError(
             f"Detail fetch timed out for job {position_id} after {_FETCH_OUTER_TIMEOUT_S}s"
         ) from e
     except Exception as e:
         logger.error(f"Error fetching job details for {position_id}: {e}")
-        raise JobDetailsFetchError(f"Failed to fetch details for job {position_id}: {e}") from e
+        error_cls = (
+            JobDetailsTransientError if _is_transient_fetch_error(str(e)) else JobDetailsFetchError
+        )
+        raise error_cls(f"Failed to fetch details for job {position_id}: {e}") from e
 
 
 def _parse_details_response(data: Dict[str, Any], position_id: str) -> Dict[str, Any]:
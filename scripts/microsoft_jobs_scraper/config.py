@@ -54,6 +54,11 @@ REQUEST_DELAY_MAX = 5.0  # random jitter
 PAGE_LOAD_TIMEOUT = 30000  # milliseconds
 SESSION_ESTABLISH_DELAY = 2.0  # seconds to wait after page load for session
 
+# Detail fetch retries (transient 5xx/429/timeouts only)
+# Backoff starts at REQUEST_DELAY_MIN so a retry never outpaces normal pacing.
+DETAIL_FETCH_MAX_ATTEMPTS = 3  # total attempts per job, including the first
+DETAIL_FETCH_RETRY_MAX = 20.0  # cap on a single backoff wait (seconds)
+
 # Pagination
 JOBS_PER_PAGE = 10  # Microsoft's API returns 10 jobs per page
 MAX_PAGES = 500  # Safety limit (500 * 10 = 5000 jobs max)
@@ -15,6 +15,11 @@ from .config import BASE_URL
 
 logger = logging.getLogger(__name__)
 
+# Position-ID URL shapes, compiled once: extract_position_id_from_url runs
+# per card in extract_job_cards and per job in transform_to_job_model.
+_POSITION_ID_PARAM_RE = re.compile(r"position_id=([^&]+)")
+_POSITION_ID_PATH_RE = re.compile(r"/positions?/(\d+)")
+
 
 class JobCardExtractionError(Exception):
     """Raised when job card extraction fails (page structure changed, blocked, etc.)"""
@@ -218,12 +223,12 @@ def extract_position_id_from_url(url: str) -> Optional[str]:
 
     try:
         # Pattern 1: position_id parameter
-        match = re.search(r"position_id=([^&]+)", url)
+        match = _POSITION_ID_PARAM_RE.search(url)
         if match:
             return match.group(1)
 
         # Pattern 2: /positions/ID or /position/ID
-        match = re.search(r"/positions?/(\d+)", url)
+        match = _POSITION_ID_PATH_RE.search(url)
         if match:
             return match.group(1)
 
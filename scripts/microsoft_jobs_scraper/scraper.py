@@ -14,6 +14,14 @@ import sys
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional
 from playwright.async_api import Page
+from tenacity import (
+    AsyncRetrying,
+    before_sleep_log,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
 
 # Add shared module to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,7 +29,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.base_scraper import BaseScraper
 from shared.constants import SourceId
 from shared.models import JobListing
-from shared.utils import get_iso_timestamp
+from shared.utils import compile_title_filter, get_iso_timestamp
 
 from .config import (
     BASE_URL,
@@ -33,6 +41,8 @@ from .config import (
     REQUEST_DELAY_MIN,
     REQUEST_DELAY_MAX,
     SESSION_ESTABLISH_DELAY,
+    DETAIL_FETCH_MAX_ATTEMPTS,
+    DETAIL_FETCH_RETRY_MAX,
     SEARCH_QUERIES,
     INCLUDE_TITLE_KEYWORDS,
     EXCLUDE_TITLE_KEYWORDS,
@@ -49,10 +59,20 @@ from .api_client import (
     get_apply_url,
     JobSearchError,
     JobDetailsFetchError,
+    JobDetailsTransientError,
 )
 
 logger = logging.getLogger(__name__)
 
+_should_include_job = compile_title_filter(INCLUDE_TITLE_KEYWORDS, EXCLUDE_TITLE_KEYWORDS)
+
+# Detail-fetch backoff: REQUEST_DELAY_MIN doubling per retry (capped at
+# DETAIL_FETCH_RETRY_MAX) plus the same jitter band as normal request pacing,
+# so a retry never hits the API sooner than an ordinary request would.
+_DETAIL_FETCH_WAIT = wait_exponential(
+    multiplier=REQUEST_DELAY_MIN, min=REQUEST_DELAY_MIN, max=DETAIL_FETCH_RETRY_MAX
+) + wait_random(0, REQUEST_DELAY_MAX - REQUEST_DELAY_MIN)
+
 
 class MicrosoftJobsScraper(BaseScraper):
     """Main scraper class for Microsoft Careers (extends BaseScraper)"""
@@ -130,14 +150,7 @@ class MicrosoftJobsScraper(BaseScraper):
 
     def filter_job(self, job_title: str) -> bool:
         """Filter job by title keywords using include/exclude keyword lists"""
-        title_lower = job_title.lower()
-
-        # Check for exclusion keywords first
-        if any(kw.lower() in title_lower for kw in EXCLUDE_TITLE_KEYWORDS):
-            return False
-
-        # Check for inclusion keywords
-        return any(kw.lower() in title_lower for kw in INCLUDE_TITLE_KEYWORDS)
+        return _should_include_job(job_title)
 
     async def _fetch_page_jobs(
         self, page: Page, search_query: str, page_num: int
@@ -241,6 +254,25 @@ class MicrosoftJobsScraper(BaseScraper):
         # Wait for page to fully load
         await asyncio.sleep(SESSION_ESTABLISH_DELAY)
 
+    async def _fetch_details_with_retry(self, page: Page, position_id: str) -> Dict[str, Any]:
+        """
+        Fetch job details, retrying JobDetailsTransientError with backoff.
+
+        Only timeouts, 5xx and 429 are retried; those usually clear within a
+        few seconds. Other JobDetailsFetchErrors (403/404 blocks, parse errors)
+        would fail the same way again, so they propagate on the first attempt.
+        Re-raises the last error once attempts run out.
+        """
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(DETAIL_FETCH_MAX_ATTEMPTS),
+            wait=_DETAIL_FETCH_WAIT,
+            retry=retry_if_exception_type(JobDetailsTransientError),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        ):
+            with attempt:
+                return await fetch_job_details(page, position_id)
+
     async def scrape_job_details_batch(
         self, job_cards: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -365,7 +397,7 @@ class MicrosoftJobsScraper(BaseScraper):
                 )
 
                 try:
-                    details = await fetch_job_details(page, position_id)
+                    details = await self._fetch_details_with_retry(page, position_id)
                     yield {**job_card, **details}
                 except JobDetailsFetchError as e:
                     logger.error(f"Detail fetch failed for {position_id}: {e}")
@@ -374,6 +406,10 @@ class MicrosoftJobsScraper(BaseScraper):
                     logger.error(f"Unexpected error fetching details for {position_id}: {e}")
                     yield {**job_card, "_detail_fetch_failed": True}
 
-                await self._random_delay()
+                # Pace requests *between* fetches only: fetches stay serial on
+                # purpose (bot detection), but a delay after the last card
+                # just adds 2-5s to every batch.
+                if i < total:
+                    await self._random_delay()
         finally:
             await page.close()
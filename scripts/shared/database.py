@@ -10,7 +10,7 @@ import logging
 import os
 import re
 from datetime import datetime
-from typing import Set, List, Optional, Dict, Any, Tuple
+from typing import Set, List, Optional, Dict, Any, Tuple, Iterable
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode, quote
 
 import psycopg2
@@ -142,6 +142,18 @@ _FRESHNESS_UPSERT = f"""
         consecutive_misses = 0
 """.strip()
 
+# Shared head of every reader that returns full job rows. Freshness
+# (last_seen_at / consecutive_misses) lives only in the sidecar, so these
+# readers always join it. Table names are fixed constants, so the statement
+# text is built once here rather than re-formatted on every call; callers
+# append only their WHERE clause.
+_SELECT_JOB_WITH_FRESHNESS = (
+    f"SELECT {_JOBS_TABLE}.*, f.last_seen_at, f.consecutive_misses "
+    f"FROM {_JOBS_TABLE} "
+    f"JOIN {_FRESHNESS_TABLE} f "
+    f"  ON f.source_id = {_JOBS_TABLE}.source_id AND f.id = {_JOBS_TABLE}.id "
+)
+
 
 def _upsert_freshness(cursor: Any, jobs: List[JobListing]) -> None:
     """Advance ``job_freshness`` for the re-seen/reactivated ``jobs``.
@@ -188,19 +200,6 @@ def _build_job_values(job: JobListing) -> Tuple:
     )
 
 
-def _build_id_placeholders(ids: List[str]) -> str:
-    """
-    Build SQL placeholders for a list of IDs.
-
-    Args:
-        ids: List of IDs
-
-    Returns:
-        Comma-separated %s placeholders (e.g., "%s,%s,%s")
-    """
-    return ','.join(['%s' for _ in ids])
-
-
 def get_connection(
     db_url: str,
     *,
@@ -423,37 +422,79 @@ def get_job_by_id(
     # job_listings columns are gone (Unit 4 contract migration 18fe9c20a8fd), so
     # the appended f.* columns are now the only source of these two keys.
     cursor.execute(
-        f"SELECT {_JOBS_TABLE}.*, f.last_seen_at, f.consecutive_misses "
-        f"FROM {_JOBS_TABLE} "
-        f"JOIN {_FRESHNESS_TABLE} f "
-        f"  ON f.source_id = {_JOBS_TABLE}.source_id AND f.id = {_JOBS_TABLE}.id "
-        f"WHERE {_JOBS_TABLE}.source_id = %s AND {_JOBS_TABLE}.id = %s",
+        _SELECT_JOB_WITH_FRESHNESS
+        + f"WHERE {_JOBS_TABLE}.source_id = %s AND {_JOBS_TABLE}.id = %s",
         (source_id, job_id),
     )
     row = cursor.fetchone()
 
-    if row:
-        return dict(row)
-    return None
+    # RealDictCursor rows are already dicts; no per-row copy.
+    return row or None
 
 
-def insert_job(conn: Connection, job: JobListing) -> None:
+def get_jobs_by_ids(
+    conn: Connection, source_id: str, job_ids: Iterable[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieve several jobs by id within one source in a single query.
+
+    Batch counterpart of ``get_job_by_id``: same columns (freshness joined
+    from the sidecar), one round trip instead of one per id.
+
+    Args:
+        conn: Database connection
+        source_id: Source namespace; ``job_ids`` must all belong to this
+            source. Must be non-empty, mirroring ``get_job_by_id``.
+        job_ids: Job ids within that source
+
+    Returns:
+        Dict mapping job id -> job data dict. Ids with no matching row are
+        simply absent.
+    """
+    if not source_id:
+        raise ValueError(
+            "get_jobs_by_ids requires a non-empty source_id"
+        )
+    job_ids = list(job_ids)
+    if not job_ids:
+        return {}
+
+    cursor = conn.cursor()
+    cursor.execute(
+        _SELECT_JOB_WITH_FRESHNESS
+        + f"WHERE {_JOBS_TABLE}.source_id = %s AND {_JOBS_TABLE}.id = ANY(%s)",
+        (source_id, job_ids),
+    )
+
+    return {row["id"]: row for row in cursor.fetchall()}
+
+
+def insert_job(conn: Connection, job: JobListing) -> Dict[str, Any]:
     """
     Insert a new job into the database
 
     Args:
         conn: Database connection
         job: JobListing model
+
+    Returns:
+        The inserted job_listings row as a dict (via RETURNING *), so callers
+        that want to verify the write don't need a follow-up get_job_by_id.
+        Freshness keys (last_seen_at / consecutive_misses) live in the
+        job_freshness sidecar and are NOT part of this row.
     """
     cursor = conn.cursor()
 
     cursor.execute(
-        f"INSERT INTO {_JOBS_TABLE} ({_JOB_COLUMNS}) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        f"INSERT INTO {_JOBS_TABLE} ({_JOB_COLUMNS}) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
+        f"RETURNING *",
         _build_job_values(job)
     )
+    row = cursor.fetchone()
 
     conn.commit()
     logger.debug(f"Inserted job: {job.id} - {job.title}")
+    return row
 
 
 def upsert_job(conn: Connection, job: JobListing) -> bool:
@@ -600,14 +641,20 @@ def insert_jobs_batch(conn: Connection, jobs: List[JobListing]) -> int:
     cursor = conn.cursor()
     values = [_build_job_values(job) for job in jobs]
 
-    execute_values(
+    # Count via RETURNING rather than cursor.rowcount: execute_values runs one
+    # statement per page and rowcount only reflects the LAST page (see the
+    # note in upsert_jobs_batch), so any batch over page_size under-reported.
+    # ON CONFLICT DO NOTHING returns no row for a skipped duplicate.
+    inserted_rows = execute_values(
         cursor,
-        f"INSERT INTO {_JOBS_TABLE} ({_JOB_COLUMNS}) VALUES %s ON CONFLICT (source_id, id) DO NOTHING",
+        f"INSERT INTO {_JOBS_TABLE} ({_JOB_COLUMNS}) VALUES %s "
+        f"ON CONFLICT (source_id, id) DO NOTHING RETURNING id",
         values,
-        page_size=100
+        page_size=100,
+        fetch=True,
     )
 
-    actual_inserted = cursor.rowcount
+    actual_inserted = len(inserted_rows)
     conn.commit()
     logger.info(f"Batch inserted {actual_inserted}/{len(jobs)} jobs (skipped {len(jobs) - actual_inserted} duplicates)")
     return actual_inserted
@@ -635,15 +682,16 @@ def update_last_seen(
         return
 
     cursor = conn.cursor()
-    placeholders = _build_id_placeholders(job_ids)
 
     # Freshness lives in the job_freshness sidecar now, not on job_listings.
     # Every OPEN listing has a freshness row (AFTER INSERT trigger + backfill),
     # so this UPDATE matches the same rows the old job_listings UPDATE did.
+    # ids travel as one text[] bound to = ANY(%s): the statement text stays the
+    # same whatever the batch size, instead of growing an IN (%s, %s, ...) list.
     cursor.execute(
         f"UPDATE {_FRESHNESS_TABLE} SET last_seen_at = %s, consecutive_misses = 0 "
-        f"WHERE source_id = %s AND id IN ({placeholders})",
-        [timestamp, source_id] + job_ids
+        f"WHERE source_id = %s AND id = ANY(%s)",
+        (timestamp, source_id, list(job_ids))
     )
 
     affected = cursor.rowcount
@@ -681,15 +729,14 @@ def increment_consecutive_misses(
         return
 
     cursor = conn.cursor()
-    placeholders = _build_id_placeholders(job_ids)
 
     # consecutive_misses lives in the job_freshness sidecar now (see
     # update_last_seen). Bumping it here no longer rewrites the wide job_listings
     # row / its indexes.
     cursor.execute(
         f"UPDATE {_FRESHNESS_TABLE} SET consecutive_misses = consecutive_misses + 1 "
-        f"WHERE source_id = %s AND id IN ({placeholders})",
-        [source_id] + job_ids
+        f"WHERE source_id = %s AND id = ANY(%s)",
+        (source_id, list(job_ids))
     )
 
     affected = cursor.rowcount
@@ -708,6 +755,92 @@ def increment_consecutive_misses(
         )
 
 
+def refresh_and_close_jobs(
+    conn: Connection,
+    source_id: str,
+    seen_ids: List[str],
+    missing_ids: List[str],
+    timestamp: str,
+    threshold: int,
+) -> List[str]:
+    """
+    Apply one run's freshness update and the resulting closures in one statement.
+
+    Does what ``update_last_seen(seen_ids)``,
+    ``increment_consecutive_misses(missing_ids)`` and ``mark_jobs_closed`` on
+    the missing ids that reached ``threshold`` do, as a single data-modifying
+    CTE: the sidecar UPDATE's RETURNING rows drive the job_listings UPDATE.
+    One round trip and one commit, and the two tables can never be left
+    half-applied.
+
+    Args:
+        conn: Database connection
+        source_id: Source namespace; both id lists must belong to this
+            source. Must be non-empty; an empty value would silently no-op.
+        seen_ids: Job IDs present in this run's results
+        missing_ids: Previously-active job IDs absent from this run's results.
+            Must be disjoint from ``seen_ids``.
+        timestamp: ISO 8601 timestamp for last_seen_at and closed_on
+        threshold: Post-increment consecutive_misses at which a missing job
+            is marked CLOSED
+
+    Returns:
+        IDs of the jobs marked CLOSED by this call
+    """
+    if not source_id:
+        raise ValueError(
+            "refresh_and_close_jobs requires a non-empty source_id"
+        )
+    seen_ids = list(seen_ids)
+    missing_ids = list(missing_ids)
+    if not seen_ids and not missing_ids:
+        return []
+
+    cursor = conn.cursor()
+
+    cursor.execute(
+        f"WITH fresh AS ("
+        f"  UPDATE {_FRESHNESS_TABLE} SET "
+        f"    last_seen_at = CASE WHEN id = ANY(%(seen)s) THEN %(ts)s::timestamptz ELSE last_seen_at END, "
+        f"    consecutive_misses = CASE WHEN id = ANY(%(seen)s) THEN 0 ELSE consecutive_misses + 1 END "
+        f"  WHERE source_id = %(source_id)s AND id = ANY(%(all_ids)s) "
+        f"  RETURNING id, consecutive_misses"
+        f"), closed AS ("
+        f"  UPDATE {_JOBS_TABLE} j SET status = 'CLOSED', closed_on = %(ts)s "
+        f"  FROM fresh "
+        f"  WHERE j.source_id = %(source_id)s AND j.id = fresh.id "
+        f"    AND fresh.id = ANY(%(missing)s) AND fresh.consecutive_misses >= %(threshold)s "
+        f"  RETURNING j.id"
+        f") "
+        f"SELECT (SELECT count(*) FROM fresh) AS refreshed, "
+        f"       ARRAY(SELECT id FROM closed) AS closed_ids",
+        {
+            "seen": seen_ids,
+            "missing": missing_ids,
+            "ts": timestamp,
+            "source_id": source_id,
+            "all_ids": seen_ids + missing_ids,
+            "threshold": threshold,
+        },
+    )
+    row = cursor.fetchone()
+    affected, closed_ids = row["refreshed"], list(row["closed_ids"])
+
+    conn.commit()
+    expected = len(seen_ids) + len(missing_ids)
+    if affected != expected:
+        logger.warning(
+            "refresh_and_close_jobs affected %d/%d rows for source_id=%s — "
+            "%d ids did not match the composite (source_id, id) key",
+            affected, expected, source_id, expected - affected,
+        )
+    logger.info(
+        "Refreshed %d seen / %d missing jobs, closed %d (source_id=%s)",
+        len(seen_ids), len(missing_ids), len(closed_ids), source_id,
+    )
+    return closed_ids
+
+
 def mark_jobs_closed(
     conn: Connection, source_id: str, job_ids: List[str], timestamp: str
 ) -> None:
@@ -730,12 +863,11 @@ def mark_jobs_closed(
         return
 
     cursor = conn.cursor()
-    placeholders = _build_id_placeholders(job_ids)
 
     cursor.execute(
         f"UPDATE {_JOBS_TABLE} SET status = 'CLOSED', closed_on = %s "
-        f"WHERE source_id = %s AND id IN ({placeholders})",
-        [timestamp, source_id] + job_ids
+        f"WHERE source_id = %s AND id = ANY(%s)",
+        (timestamp, source_id, list(job_ids))
     )
 
     affected = cursor.rowcount
@@ -778,16 +910,15 @@ def get_jobs_exceeding_miss_threshold(
         return set()
 
     cursor = conn.cursor()
-    placeholders = _build_id_placeholders(job_ids)
 
     # consecutive_misses is read from the job_freshness sidecar now. Every
     # listing has a freshness row (trigger + FK), so this sees the same ids the
     # old job_listings read did.
     cursor.execute(
         f"SELECT id FROM {_FRESHNESS_TABLE} "
-        f"WHERE source_id = %s AND id IN ({placeholders}) "
+        f"WHERE source_id = %s AND id = ANY(%s) "
         f"AND consecutive_misses >= %s",
-        [source_id] + job_ids + [threshold]
+        (source_id, list(job_ids), threshold)
     )
 
     return {row['id'] for row in cursor.fetchall()}
@@ -990,17 +1121,13 @@ def get_all_active_jobs(conn: Connection, company: str) -> List[JobListing]:
     cursor = conn.cursor()
 
     cursor.execute(
-        f"SELECT {_JOBS_TABLE}.*, f.last_seen_at, f.consecutive_misses "
-        f"FROM {_JOBS_TABLE} "
-        f"JOIN {_FRESHNESS_TABLE} f "
-        f"  ON f.source_id = {_JOBS_TABLE}.source_id AND f.id = {_JOBS_TABLE}.id "
-        f"WHERE company = %s AND status = 'OPEN'",
+        _SELECT_JOB_WITH_FRESHNESS
+        + "WHERE company = %s AND status = 'OPEN'",
         (company,)
     )
 
     jobs = []
-    for row in cursor.fetchall():
-        row_dict = dict(row)
+    for row_dict in cursor.fetchall():
         for json_col in ('details', 'ai_metadata'):
             if isinstance(row_dict.get(json_col), str):
                 row_dict[json_col] = json.loads(row_dict[json_col])
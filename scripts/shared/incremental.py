@@ -52,6 +52,7 @@ auto-release that keeps a *permanent* board shrink from latching forever.
 import logging
 import os
 import uuid
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, NamedTuple, Optional, Set, Tuple
 
 from .models import JobListing, ScrapeRun
@@ -427,32 +428,23 @@ def resolve_safety_guard(
     return GuardDecision(reason=resolved, released=resolved is None)
 
 
+@dataclass(slots=True)
 class ScrapeResult:
     """Result object returned by incremental scrape"""
 
-    def __init__(
-        self,
-        jobs_seen: int = 0,
-        new_jobs: int = 0,
-        closed_jobs: int = 0,
-        details_fetched: int = 0,
-        error_count: int = 0,
-        run_id: str = None,
-        skipped_update: bool = False,
-        guard_reason: Optional[GuardReason] = None,
-    ):
-        self.jobs_seen = jobs_seen
-        self.new_jobs = new_jobs
-        self.closed_jobs = closed_jobs
-        self.details_fetched = details_fetched
-        self.error_count = error_count
-        self.run_id = run_id or str(uuid.uuid4())
-        self.skipped_update = skipped_update
-        # Which rule tripped, if any: None | "empty_scrape" | "partial_scrape".
-        # Persisted so the release counter can distinguish them — counting the
-        # skipped_update boolean (which BOTH rules set) let a total outage
-        # release the very next truncated run.
-        self.guard_reason = guard_reason
+    jobs_seen: int = 0
+    new_jobs: int = 0
+    closed_jobs: int = 0
+    details_fetched: int = 0
+    error_count: int = 0
+    # Same uuid4 string format the backend ATS tasks write to scrape_runs.
+    run_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    skipped_update: bool = False
+    # Which rule tripped, if any: None | "empty_scrape" | "partial_scrape".
+    # Persisted so the release counter can distinguish them — counting the
+    # skipped_update boolean (which BOTH rules set) let a total outage
+    # release the very next truncated run.
+    guard_reason: Optional[GuardReason] = None
 
 
 def calculate_job_diff(
@@ -570,29 +562,19 @@ def update_existing_jobs(
         raise ValueError(
             "update_existing_jobs requires a non-empty source_id"
         )
-    timestamp = get_iso_timestamp()
-
-    # Update last_seen for still active jobs
-    if still_active_ids:
-        db.update_last_seen(db_conn, source_id, list(still_active_ids), timestamp)
-
-    if not missing_ids:
+    if not still_active_ids and not missing_ids:
         return 0
 
-    # Increment consecutive_misses for missing jobs
-    db.increment_consecutive_misses(db_conn, source_id, list(missing_ids))
+    timestamp = get_iso_timestamp()
 
-    # Check which jobs have exceeded threshold and mark as closed (single query)
-    # Note: consecutive_misses was already incremented above, so we check >= threshold
-    jobs_to_close = db.get_jobs_exceeding_miss_threshold(
-        db_conn, source_id, list(missing_ids), threshold
+    # Reset still-active jobs, bump misses on missing ones and close those
+    # reaching the threshold in one statement; the seen/missing partition
+    # itself is already computed by the caller.
+    closed_ids = db.refresh_and_close_jobs(
+        db_conn, source_id, list(still_active_ids), list(missing_ids),
+        timestamp, threshold,
     )
-
-    if jobs_to_close:
-        db.mark_jobs_closed(db_conn, source_id, list(jobs_to_close), timestamp)
-        return len(jobs_to_close)
-
-    return 0
+    return len(closed_ids)
 
 
 async def run_incremental_scrape(
@@ -633,6 +615,13 @@ async def run_incremental_scrape(
 
     try:
         # Phase 1: Quick list scrape (no details)
+        #
+        # The full card list is materialized on purpose rather than streamed
+        # page by page: the safety guard below compares the COMPLETE seen
+        # count against the active DB count before any ingest/update/close
+        # write happens. Writing new jobs while pages are still arriving
+        # would let a truncated scrape ingest before the guard could veto it.
+        # Cards are small list-page dicts, so even a 10k-job board is a few MB.
         logger.info("Phase 1: Quick list scrape...")
         job_cards = await scraper.scrape_all_queries()
         result.jobs_seen = len(job_cards)
@@ -3,7 +3,9 @@ Shared utility functions for scrapers
 """
 
 import logging
+import re
 from datetime import datetime, timezone
+from typing import Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -11,3 +13,33 @@ logger = logging.getLogger(__name__)
 def get_iso_timestamp() -> str:
     """Get current timestamp in ISO 8601 format (UTC) with microsecond precision"""
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """One case-insensitive alternation of the escaped keywords; never matches if empty"""
+    keywords = list(keywords)
+    if not keywords:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def compile_title_filter(
+    include_keywords: Iterable[str], exclude_keywords: Iterable[str]
+) -> Callable[[str], bool]:
+    """
+    Build a title predicate from include/exclude keyword lists
+
+    Keywords match as case-insensitive substrings (no word boundaries, so
+    "engineer" matches "Engineering") and exclusions take priority. Each list
+    is compiled once into a single alternation, so a title is scanned once
+    per list instead of once per keyword.
+    """
+    exclude_re = _keyword_pattern(exclude_keywords)
+    include_re = _keyword_pattern(include_keywords)
+
+    def should_include_job(title: str) -> bool:
+        if exclude_re.search(title):
+            return False
+        return include_re.search(title) is not None
+
+    return should_include_job
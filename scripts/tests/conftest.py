@@ -4,11 +4,11 @@ Shared pytest fixtures for the scraper test suite
 
 import logging
 import os
-import sys
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+from unittest.mock import MagicMock
 
 import pytest
 import psycopg2
@@ -16,16 +16,9 @@ from psycopg2.extras import RealDictCursor
 
 logger = logging.getLogger(__name__)
 
-# Add scripts directory to path for imports
-scripts_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(scripts_dir))
-
-# Also add src/backend so we can import api.db_models.Base and api.migrations.
-# Used only by the postgres_db fixture for schema bootstrap (mirrors the
-# Unit 4 backend conftest pattern).
-_repo_root = Path(__file__).parent.parent.parent
-src_backend = _repo_root / "src" / "backend"
-sys.path.insert(0, str(src_backend))
+# `shared` (scripts/) and `api` (src/backend/, needed only by the postgres
+# schema bootstrap for api.db_models.Base and api.migrations) are importable
+# via `pythonpath` in pytest.ini.
 
 from shared.constants import SourceId
 from shared.models import JobListing, ScrapeRun
@@ -100,6 +93,41 @@ def sample_job_listing() -> JobListing:
     )
 
 
+# Validated once; make_job_listing() hands out model_copy(update=...) clones,
+# which pydantic does not re-validate.
+_JOB_LISTING_TEMPLATE = JobListing(
+    id="template",
+    title="Template",
+    company="google",
+    url="https://example.com/template",
+    source_id=SourceId.GOOGLE,
+    created_at="2024-01-15T10:30:00Z",
+    first_seen_at="2024-01-15T10:30:00Z",
+    last_seen_at="2024-01-15T10:30:00Z",
+)
+
+
+def _make_job_listing(job_id: str, **overrides: Any) -> JobListing:
+    # model_copy is shallow: hand each clone its own dicts.
+    return _JOB_LISTING_TEMPLATE.model_copy(update={
+        "id": job_id,
+        "details": {},
+        "ai_metadata": {},
+        **overrides,
+    })
+
+
+@pytest.fixture
+def make_job_listing() -> Callable[..., JobListing]:
+    """
+    Factory for minimal valid JobListings
+
+    Call as ``make_job_listing(job_id, **overrides)``: a Google listing seen
+    at 2024-01-15T10:30:00Z whose fields are replaced by ``overrides``.
+    """
+    return _make_job_listing
+
+
 @pytest.fixture
 def sample_scrape_run() -> ScrapeRun:
     """Valid ScrapeRun model instance"""
@@ -117,98 +145,142 @@ def sample_scrape_run() -> ScrapeRun:
     )
 
 
-@pytest.fixture
-def postgres_db():
-    """PostgreSQL database connection with per-test schema isolation.
-
-    Creates `test_<hex>` schema, points `search_path` via `PYTEST_SCHEMA`,
-    runs Alembic (populates bare-named tables + alembic_version inside the
-    schema). Yields the psycopg2 connection tests use. Teardown DROP SCHEMA
-    CASCADE — no per-table loop.
-    """
-    import secrets
-
-    schema = "test_" + secrets.token_hex(4)
-
+@contextmanager
+def _pytest_schema_env(schema: str):
+    """Point DATABASE_URL / PYTEST_SCHEMA at the test schema, then restore."""
     prev_database_url = os.environ.get("DATABASE_URL")
     prev_pytest_schema = os.environ.get("PYTEST_SCHEMA")
 
     os.environ["DATABASE_URL"] = TEST_DB_URL
     os.environ["PYTEST_SCHEMA"] = schema
-
-    # Create the schema on a one-off connection before Alembic runs.
-    bootstrap_conn = psycopg2.connect(TEST_DB_URL)
     try:
-        bootstrap_conn.autocommit = True
-        with bootstrap_conn.cursor() as cur:
-            cur.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+        yield
     finally:
-        bootstrap_conn.close()
-
-    # The Alembic baseline revision is empty; the user tables must be
-    # materialized via Base.metadata.create_all. Pin search_path on each
-    # engine connection so the DDL lands inside the test schema, not public.
-    from sqlalchemy import create_engine, event
-    import api.db_models as _db_models
+        if prev_pytest_schema is None:
+            os.environ.pop("PYTEST_SCHEMA", None)
+        else:
+            os.environ["PYTEST_SCHEMA"] = prev_pytest_schema
+        if prev_database_url is None:
+            os.environ.pop("DATABASE_URL", None)
+        else:
+            os.environ["DATABASE_URL"] = prev_database_url
+
+
+@pytest.fixture(scope="session")
+def _postgres_schema():
+    """Per-session `test_<hex>` schema with the full table set materialized.
+
+    Building the schema (create_all + Alembic stamp) dominates per-test cost,
+    so it runs once per pytest session; postgres_db truncates the data between
+    tests instead. Teardown DROP SCHEMA CASCADE — no per-table loop.
+    """
+    import secrets
 
-    engine = create_engine(TEST_DB_URL)
+    # Under pytest-xdist each worker process runs this session fixture, so
+    # every worker gets its own random schema. Keep the bare `test_<hex>`
+    # shape: alembic/env.py refuses anything else.
+    schema = "test_" + secrets.token_hex(4)
 
-    @event.listens_for(engine, "connect")
-    def _set_search_path(dbapi_conn, _conn_record):
-        cur = dbapi_conn.cursor()
+    with _pytest_schema_env(schema):
+        # Create the schema on a one-off connection before Alembic runs.
+        bootstrap_conn = psycopg2.connect(TEST_DB_URL)
         try:
-            cur.execute(f'SET search_path TO "{schema}", public')
+            bootstrap_conn.autocommit = True
+            with bootstrap_conn.cursor() as cur:
+                cur.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
         finally:
-            cur.close()
+            bootstrap_conn.close()
+
+        # The Alembic baseline revision is empty; the user tables must be
+        # materialized via Base.metadata.create_all. Pin search_path on each
+        # engine connection so the DDL lands inside the test schema, not public.
+        from sqlalchemy import create_engine, event
+        import api.db_models as _db_models
 
-    # checkfirst=False is critical: SQLAlchemy's default existence probe
-    # sees `public.job_listings` in shared dev DBs and skips creation,
-    # leaving the test schema empty. search_path pins where DDL LANDS, but
-    # the probe query looks across all schemas.
-    _db_models.Base.metadata.create_all(engine, checkfirst=False)
-    engine.dispose()
+        engine = create_engine(TEST_DB_URL)
+
+        @event.listens_for(engine, "connect")
+        def _set_search_path(dbapi_conn, _conn_record):
+            cur = dbapi_conn.cursor()
+            try:
+                cur.execute(f'SET search_path TO "{schema}", public')
+            finally:
+                cur.close()
 
-    # create_all already materialized every ORM table; stamp (not upgrade)
-    # avoids re-running each migration body against tables that already exist.
-    from api.migrations import stamp_alembic_head
-    stamp_alembic_head(TEST_DB_URL)
+        # checkfirst=False is critical: SQLAlchemy's default existence probe
+        # sees `public.job_listings` in shared dev DBs and skips creation,
+        # leaving the test schema empty. search_path pins where DDL LANDS, but
+        # the probe query looks across all schemas.
+        _db_models.Base.metadata.create_all(engine, checkfirst=False)
+        engine.dispose()
 
-    conn = psycopg2.connect(TEST_DB_URL, cursor_factory=RealDictCursor)
-    with conn.cursor() as cur:
-        cur.execute(f'SET search_path TO "{schema}", public')
-    conn.commit()
+        # create_all already materialized every ORM table; stamp (not upgrade)
+        # avoids re-running each migration body against tables that already exist.
+        from api.migrations import stamp_alembic_head
+        stamp_alembic_head(TEST_DB_URL)
 
     try:
-        yield conn
+        yield schema
     finally:
-        # Close the test connection BEFORE DROP SCHEMA — otherwise the DROP
-        # blocks on this session's reference to the schema (search_path +
-        # any open transactions). A leaked open conn → teardown deadlock.
+        drop_conn = psycopg2.connect(TEST_DB_URL)
+        drop_conn.autocommit = True
         try:
+            with drop_conn.cursor() as cur:
+                cur.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+        finally:
+            drop_conn.close()
+
+
+@pytest.fixture
+def postgres_db(_postgres_schema):
+    """PostgreSQL database connection with per-test data isolation.
+
+    Reuses the session's `test_<hex>` schema (see _postgres_schema) and points
+    `search_path` via `PYTEST_SCHEMA`. Yields the psycopg2 connection tests
+    use. Teardown TRUNCATEs every table except alembic_version, so each test
+    still starts from empty tables.
+    """
+    schema = _postgres_schema
+
+    with _pytest_schema_env(schema):
+        conn = psycopg2.connect(TEST_DB_URL, cursor_factory=RealDictCursor)
+        with conn.cursor() as cur:
+            cur.execute(f'SET search_path TO "{schema}", public')
+            # Test data never outlives the test (its tables are TRUNCATEd at
+            # teardown, the schema dropped at session end), so durability buys
+            # nothing here. Skipping the WAL flush on COMMIT makes the
+            # per-statement commits in the database helpers cheaper.
+            cur.execute("SET synchronous_commit TO off")
+        conn.commit()
+
+        try:
+            yield conn
+        finally:
+            # Close the test connection BEFORE truncating — a leaked open
+            # transaction would hold locks the TRUNCATE has to wait on.
             if not conn.closed:
                 try:
                     conn.rollback()
                 except Exception:
                     pass
                 conn.close()
-        finally:
+
+            reset_conn = psycopg2.connect(TEST_DB_URL)
+            reset_conn.autocommit = True
             try:
-                drop_conn = psycopg2.connect(TEST_DB_URL)
-                drop_conn.autocommit = True
-                try:
-                    with drop_conn.cursor() as cur:
-                        cur.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
-                finally:
-                    drop_conn.close()
+                with reset_conn.cursor() as cur:
+                    cur.execute(
+                        "SELECT tablename FROM pg_tables "
+                        "WHERE schemaname = %s AND tablename <> 'alembic_version'",
+                        (schema,),
+                    )
+                    tables = ", ".join(
+                        f'"{schema}"."{name}"' for (name,) in cur.fetchall()
+                    )
+                    if tables:
+                        cur.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
             finally:
-                if prev_pytest_schema is None:
-                    os.environ.pop("PYTEST_SCHEMA", None)
-                else:
-                    os.environ["PYTEST_SCHEMA"] = prev_pytest_schema
-                if prev_database_url is None:
-                    os.environ.pop("DATABASE_URL", None)
-                else:
-                    os.environ["DATABASE_URL"] = prev_database_url
+                reset_conn.close()
 
 
 # Alias for backwards compatibility
@@ -220,18 +292,69 @@ def in_memory_db(postgres_db):
     return postgres_db
 
 
+class FakeScraper:
+    """
+    Hand-rolled stand-in for a GoogleJobsScraper (no browser, no Mock)
+
+    Exposes only what run_incremental_scrape and BatchWriter call.
+    ``details`` is merged into every card on the streaming detail path.
+    ``transform`` is either a fixed JobListing or a ``card -> JobListing``
+    callable. ``streaming_calls`` and ``transform_calls`` replace Mock's
+    assert_called* bookkeeping.
+    """
+
+    SOURCE_ID = SourceId.GOOGLE
+
+    def __init__(
+        self,
+        cards: Optional[List[Dict[str, Any]]] = None,
+        details: Optional[Dict[str, Any]] = None,
+        transform: Union[JobListing, Callable[[Dict[str, Any]], JobListing], None] = None,
+    ):
+        self.cards = cards or []
+        self.details = details or {}
+        self.transform = transform
+        self.streaming_calls: List[List[Dict[str, Any]]] = []
+        self.transform_calls = 0
+
+    def get_company_name(self) -> str:
+        return "google"
+
+    async def scrape_all_queries(self) -> List[Dict[str, Any]]:
+        return self.cards
+
+    async def scrape_job_details_streaming(
+        self, job_cards: List[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        self.streaming_calls.append(list(job_cards))
+        for card in job_cards:
+            yield {**card, **self.details}
+
+    def transform_to_job_model(self, job_data: Dict[str, Any]) -> Optional[JobListing]:
+        self.transform_calls += 1
+        if callable(self.transform):
+            return self.transform(job_data)
+        return self.transform
+
+
 @pytest.fixture
-def mock_scraper():
+def mock_scraper_factory():
+    """
+    Factory for FakeScraper instances
+
+    Call with the list-page ``cards``, the ``details`` to merge and/or the
+    ``transform`` result a test needs; anything omitted keeps the empty
+    default. Each call returns an independent fake.
+    """
+    return FakeScraper
+
+
+@pytest.fixture
+def mock_scraper(mock_scraper_factory):
     """
     Mocked GoogleJobsScraper for testing without browser
     """
-    scraper = MagicMock()
-    scraper.get_company_name.return_value = "google"
-    scraper.SOURCE_ID = SourceId.GOOGLE
-    scraper.scrape_all_queries = AsyncMock(return_value=[])
-    scraper.scrape_job_details_batch = AsyncMock(return_value=[])
-    scraper.transform_to_job_model = MagicMock()
-    return scraper
+    return mock_scraper_factory()
 
 
 @pytest.fixture
@@ -286,9 +409,14 @@ def mock_playwright_page():
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def microsoft_scraper():
-    """MicrosoftJobsScraper instance for transformation tests"""
+    """MicrosoftJobsScraper instance for transformation tests
+
+    Module-scoped: consumers only call pure transform/filter/URL methods.
+    Tests that need to set context, delays or other state build their own
+    instance.
+    """
     from scripts.microsoft_jobs_scraper.scraper import MicrosoftJobsScraper
     return MicrosoftJobsScraper(headless=True, detail_scrape=False)
 
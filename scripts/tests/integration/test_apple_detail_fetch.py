@@ -5,12 +5,8 @@ Tests _fetch_job_details(), scrape_job_details_batch(), and scrape_job_details_s
 """
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from apple_jobs_scraper.scraper import AppleJobsScraper
 from apple_jobs_scraper.api_client import JobDetailsFetchError
 
@@ -6,10 +6,6 @@ Tests the data transformation, deduplication logic, and filter methods.
 
 import pytest
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from apple_jobs_scraper.scraper import AppleJobsScraper
 from shared.models import JobListing
 
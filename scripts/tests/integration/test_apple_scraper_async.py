@@ -5,12 +5,8 @@ Tests scrape_query() and related async functionality with mocked Playwright.
 """
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from apple_jobs_scraper.scraper import AppleJobsScraper
 from apple_jobs_scraper.parser import JobCardExtractionError
 
@@ -8,10 +8,6 @@ import pytest
 import json
 from datetime import datetime
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from shared.constants import SourceId
 from shared.models import JobListing, ScrapeRun
 from shared import database as db
@@ -24,26 +20,38 @@ def _parse_ts(value):
     return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
+@pytest.fixture
+def seeded_db(in_memory_db, sample_job_listing):
+    """in_memory_db with sample_job_listing already inserted"""
+    db.insert_job(in_memory_db, sample_job_listing)
+    return in_memory_db
+
+
 class TestInsertAndRetrieve:
     """Tests for insert_job and get_job_by_id functions"""
 
     def test_insert_job_and_retrieve(self, in_memory_db, sample_job_listing):
-        """Insert JobListing, verify with get_job_by_id"""
-        db.insert_job(in_memory_db, sample_job_listing)
+        """insert_job returns the inserted row (RETURNING *)"""
+        inserted = db.insert_job(in_memory_db, sample_job_listing)
+
+        assert inserted["id"] == sample_job_listing.id
+        assert inserted["source_id"] == sample_job_listing.source_id
+        assert inserted["title"] == sample_job_listing.title
+        assert inserted["company"] == sample_job_listing.company
+        assert inserted["status"] == "OPEN"
+
+    def test_insert_job_row_matches_get_job_by_id(self, in_memory_db, sample_job_listing):
+        """The returned row agrees with a fresh read of the same job"""
+        inserted = db.insert_job(in_memory_db, sample_job_listing)
 
         retrieved = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
 
         assert retrieved is not None
-        assert retrieved["id"] == sample_job_listing.id
-        assert retrieved["title"] == sample_job_listing.title
-        assert retrieved["company"] == sample_job_listing.company
-        assert retrieved["status"] == "OPEN"
+        assert {k: retrieved[k] for k in inserted} == inserted
 
     def test_insert_job_json_serialization(self, in_memory_db, sample_job_listing):
         """Details dict serialized to JSON correctly"""
-        db.insert_job(in_memory_db, sample_job_listing)
-
-        retrieved = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
+        retrieved = db.insert_job(in_memory_db, sample_job_listing)
 
         # Details should be JSONB (already parsed by psycopg2)
         details = retrieved["details"]
@@ -58,14 +66,41 @@ class TestInsertAndRetrieve:
         assert result is None
 
 
+class TestGetJobsByIds:
+    """Tests for get_jobs_by_ids function"""
+
+    def test_returns_rows_keyed_by_id(self, in_memory_db, multiple_job_listings):
+        """One query returns every requested job, freshness included"""
+        db.insert_jobs_batch(in_memory_db, multiple_job_listings)
+
+        rows = db.get_jobs_by_ids(in_memory_db, SourceId.GOOGLE, ["job-000", "job-002"])
+
+        assert set(rows) == {"job-000", "job-002"}
+        assert rows["job-002"]["title"] == "Software Engineer 2"
+        assert rows["job-000"]["consecutive_misses"] == 0
+
+    def test_missing_ids_are_absent(self, in_memory_db, sample_job_listing):
+        """Unknown ids are skipped rather than mapped to None"""
+        db.insert_job(in_memory_db, sample_job_listing)
+
+        rows = db.get_jobs_by_ids(
+            in_memory_db, SourceId.GOOGLE, [sample_job_listing.id, "nonexistent-id"]
+        )
+
+        assert list(rows) == [sample_job_listing.id]
+
+    def test_empty_ids_returns_empty_dict(self, in_memory_db):
+        """Empty input short-circuits without a query"""
+        assert db.get_jobs_by_ids(in_memory_db, SourceId.GOOGLE, []) == {}
+
+
 class TestActiveJobIds:
     """Tests for get_active_job_ids function"""
 
     def test_get_active_job_ids_returns_open_only(self, in_memory_db, multiple_job_listings):
         """Only returns OPEN status jobs"""
         # Insert jobs
-        for job in multiple_job_listings:
-            db.insert_job(in_memory_db, job)
+        db.insert_jobs_batch(in_memory_db, multiple_job_listings)
 
         # Mark one as closed
         db.mark_jobs_closed(in_memory_db, SourceId.GOOGLE, ["job-001"], "2024-01-16T10:00:00Z")
@@ -88,26 +123,24 @@ class TestActiveJobIds:
 class TestUpdateLastSeen:
     """Tests for update_last_seen function"""
 
-    def test_update_last_seen_resets_misses(self, in_memory_db, sample_job_listing):
+    def test_update_last_seen_resets_misses(self, seeded_db, sample_job_listing):
         """Updates timestamp and resets consecutive_misses"""
-        db.insert_job(in_memory_db, sample_job_listing)
-
         # Accrue misses through the real path: the job_freshness sidecar is
         # seeded at 0 misses by the AFTER INSERT trigger (not from the model's
         # consecutive_misses), so we increment twice to reach 2.
-        db.increment_consecutive_misses(in_memory_db, sample_job_listing.source_id, [sample_job_listing.id])
-        db.increment_consecutive_misses(in_memory_db, sample_job_listing.source_id, [sample_job_listing.id])
+        db.increment_consecutive_misses(seeded_db, sample_job_listing.source_id, [sample_job_listing.id])
+        db.increment_consecutive_misses(seeded_db, sample_job_listing.source_id, [sample_job_listing.id])
 
         # Verify misses incremented
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
+        job = db.get_job_by_id(seeded_db, sample_job_listing.source_id, sample_job_listing.id)
         assert job["consecutive_misses"] == 2
 
         # Update last seen
         new_timestamp = "2024-01-20T10:00:00Z"
-        db.update_last_seen(in_memory_db, sample_job_listing.source_id, [sample_job_listing.id], new_timestamp)
+        db.update_last_seen(seeded_db, sample_job_listing.source_id, [sample_job_listing.id], new_timestamp)
 
         # Verify misses reset and timestamp updated
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
+        job = db.get_job_by_id(seeded_db, sample_job_listing.source_id, sample_job_listing.id)
         assert job["consecutive_misses"] == 0
         assert _parse_ts(job["last_seen_at"]) == _parse_ts(new_timestamp)
 
@@ -120,74 +153,68 @@ class TestUpdateLastSeen:
 class TestIncrementMisses:
     """Tests for increment_consecutive_misses function"""
 
-    def test_increment_consecutive_misses(self, in_memory_db, sample_job_listing):
+    def test_increment_consecutive_misses(self, seeded_db, sample_job_listing):
         """Increments counter correctly"""
-        db.insert_job(in_memory_db, sample_job_listing)
-
         # Increment misses
-        db.increment_consecutive_misses(in_memory_db, sample_job_listing.source_id, [sample_job_listing.id])
+        db.increment_consecutive_misses(seeded_db, sample_job_listing.source_id, [sample_job_listing.id])
 
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
+        job = db.get_job_by_id(seeded_db, sample_job_listing.source_id, sample_job_listing.id)
         assert job["consecutive_misses"] == 1
 
         # Increment again
-        db.increment_consecutive_misses(in_memory_db, sample_job_listing.source_id, [sample_job_listing.id])
+        db.increment_consecutive_misses(seeded_db, sample_job_listing.source_id, [sample_job_listing.id])
 
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
+        job = db.get_job_by_id(seeded_db, sample_job_listing.source_id, sample_job_listing.id)
         assert job["consecutive_misses"] == 2
 
 
 class TestMarkJobsClosed:
     """Tests for mark_jobs_closed function"""
 
-    def test_mark_jobs_closed(self, in_memory_db, sample_job_listing):
+    def test_mark_jobs_closed(self, seeded_db, sample_job_listing):
         """Sets status=CLOSED and closed_on timestamp"""
-        db.insert_job(in_memory_db, sample_job_listing)
-
         close_timestamp = "2024-01-20T15:00:00Z"
-        db.mark_jobs_closed(in_memory_db, sample_job_listing.source_id, [sample_job_listing.id], close_timestamp)
+        db.mark_jobs_closed(seeded_db, sample_job_listing.source_id, [sample_job_listing.id], close_timestamp)
 
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
+        job = db.get_job_by_id(seeded_db, sample_job_listing.source_id, sample_job_listing.id)
         assert job["status"] == "CLOSED"
         assert _parse_ts(job["closed_on"]) == _parse_ts(close_timestamp)
 
     def test_mark_jobs_closed_multiple(self, in_memory_db, multiple_job_listings):
         """Can close multiple jobs at once"""
-        for job in multiple_job_listings:
-            db.insert_job(in_memory_db, job)
+        db.insert_jobs_batch(in_memory_db, multiple_job_listings)
 
         ids_to_close = ["job-000", "job-001"]
         db.mark_jobs_closed(in_memory_db, SourceId.GOOGLE, ids_to_close, "2024-01-20T15:00:00Z")
 
-        for job_id in ids_to_close:
-            job = db.get_job_by_id(in_memory_db, SourceId.GOOGLE, job_id)
-            assert job["status"] == "CLOSED"
+        # One round trip for every status instead of a get_job_by_id per job
+        rows = db.get_jobs_by_ids(
+            in_memory_db, SourceId.GOOGLE, [job.id for job in multiple_job_listings]
+        )
+        statuses = {job_id: row["status"] for job_id, row in rows.items()}
 
         # job-002 should still be open
-        job = db.get_job_by_id(in_memory_db, SourceId.GOOGLE, "job-002")
-        assert job["status"] == "OPEN"
+        assert statuses == {"job-000": "CLOSED", "job-001": "CLOSED", "job-002": "OPEN"}
 
 
 class TestReactivateJob:
     """Tests for reactivate_job function"""
 
-    def test_reactivate_job(self, in_memory_db, sample_job_listing):
+    def test_reactivate_job(self, seeded_db, sample_job_listing):
         """Sets status=OPEN, clears closed_on, resets misses"""
-        db.insert_job(in_memory_db, sample_job_listing)
-
         # Close the job
-        db.mark_jobs_closed(in_memory_db, sample_job_listing.source_id, [sample_job_listing.id], "2024-01-20T15:00:00Z")
+        db.mark_jobs_closed(seeded_db, sample_job_listing.source_id, [sample_job_listing.id], "2024-01-20T15:00:00Z")
 
         # Verify closed
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
+        job = db.get_job_by_id(seeded_db, sample_job_listing.source_id, sample_job_listing.id)
         assert job["status"] == "CLOSED"
 
         # Reactivate
         reactivate_timestamp = "2024-01-21T10:00:00Z"
-        db.reactivate_job(in_memory_db, sample_job_listing.source_id, sample_job_listing.id, reactivate_timestamp)
+        db.reactivate_job(seeded_db, sample_job_listing.source_id, sample_job_listing.id, reactivate_timestamp)
 
         # Verify reactivated
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
+        job = db.get_job_by_id(seeded_db, sample_job_listing.source_id, sample_job_listing.id)
         assert job["status"] == "OPEN"
         assert job["closed_on"] is None
         assert job["consecutive_misses"] == 0
@@ -204,16 +231,17 @@ class TestScrapeRun:
         # Verify by direct query
         cursor = in_memory_db.cursor()
         cursor.execute(
-            "SELECT * FROM scrape_runs WHERE run_id = %s",
+            "SELECT company, mode, jobs_seen, new_jobs FROM scrape_runs "
+            "WHERE run_id = %s",
             (sample_scrape_run.run_id,)
         )
         row = cursor.fetchone()
 
         assert row is not None
-        assert dict(row)["company"] == "google"
-        assert dict(row)["mode"] == "incremental"
-        assert dict(row)["jobs_seen"] == 100
-        assert dict(row)["new_jobs"] == 10
+        assert row["company"] == "google"
+        assert row["mode"] == "incremental"
+        assert row["jobs_seen"] == 100
+        assert row["new_jobs"] == 10
 
     def test_record_scrape_run_persists_skipped_update(self, in_memory_db):
         """``skipped_update`` must survive the round-trip to Postgres.
@@ -544,13 +572,43 @@ class TestUpsertJobsBatchDedup:
         assert db.get_job_by_id(in_memory_db, "source_b", "shared-id") is not None
 
 
+class TestInsertJobsBatchCount:
+    """insert_jobs_batch must report inserted rows across execute_values pages"""
+
+    @staticmethod
+    def _jobs(ids):
+        return [
+            JobListing(
+                id=f"job-{i}",
+                title=f"Job {i}",
+                company="google",
+                url=f"https://example.com/job-{i}",
+                source_id=SourceId.GOOGLE,
+                created_at="2024-01-15T10:30:00Z",
+                first_seen_at="2024-01-15T10:30:00Z",
+                last_seen_at="2024-01-15T10:30:00Z",
+            )
+            for i in ids
+        ]
+
+    def test_count_spans_multiple_pages(self, in_memory_db):
+        """250 rows = 3 pages of 100; all of them are counted, not just the last page"""
+        assert db.insert_jobs_batch(in_memory_db, self._jobs(range(250))) == 250
+        assert db.count_active_jobs(in_memory_db, SourceId.GOOGLE, "google") == 250
+
+    def test_count_excludes_duplicates_on_earlier_pages(self, in_memory_db):
+        """Skipped duplicates on any page are subtracted"""
+        db.insert_jobs_batch(in_memory_db, self._jobs(range(50)))
+
+        assert db.insert_jobs_batch(in_memory_db, self._jobs(range(150))) == 100
+
+
 class TestGetAllActiveJobs:
     """Tests for get_all_active_jobs function"""
 
     def test_get_all_active_jobs(self, in_memory_db, multiple_job_listings):
         """Returns list of JobListing objects"""
-        for job in multiple_job_listings:
-            db.insert_job(in_memory_db, job)
+        db.insert_jobs_batch(in_memory_db, multiple_job_listings)
 
         # Mark one as closed
         db.mark_jobs_closed(in_memory_db, SourceId.GOOGLE, ["job-001"], "2024-01-16T10:00:00Z")
@@ -942,6 +1000,16 @@ class TestSourceScopedHelpersRejectEmptySource:
         with pytest.raises(ValueError, match="source_id"):
             db.get_job_by_id(in_memory_db, "", "job-001")
 
+    def test_get_jobs_by_ids_rejects_empty_source_id(self, in_memory_db):
+        with pytest.raises(ValueError, match="source_id"):
+            db.get_jobs_by_ids(in_memory_db, "", ["job-001"])
+
+    def test_refresh_and_close_jobs_rejects_empty_source_id(self, in_memory_db):
+        with pytest.raises(ValueError, match="source_id"):
+            db.refresh_and_close_jobs(
+                in_memory_db, "", ["job-001"], [], "2024-01-15T10:00:00Z", threshold=2
+            )
+
 
 class TestListEnabledEightfoldCompanies:
     """Lock the contract of the Eightfold fan-out's company-discovery helper.
@@ -9,10 +9,6 @@ import logging
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from shared.constants import SourceId
 from shared.models import JobListing
 from shared import database as db
@@ -28,183 +24,154 @@ from shared.incremental import (
 )
 
 
+_NEW_JOB_TS = "2024-01-15T10:30:00Z"
+_EXISTING_JOB_TS = "2024-01-10T10:00:00Z"
+
+@pytest.fixture
+def make_job(make_job_listing):
+    """Google JobListing with the given id/title/url, created and first/last seen at ``seen_at``"""
+    def _make(id_: str, title: str, url: str, *, seen_at: str = _NEW_JOB_TS, **overrides) -> JobListing:
+        return make_job_listing(
+            id_,
+            title=title,
+            url=url,
+            created_at=seen_at,
+            first_seen_at=seen_at,
+            last_seen_at=seen_at,
+            **overrides,
+        )
+    return _make
+
+
 class TestProcessNewJobs:
     """Tests for process_new_jobs function"""
 
-    @pytest.mark.asyncio
-    async def test_process_new_jobs_inserts_to_db(self, in_memory_db, mock_scraper):
-        """New jobs inserted into database"""
-        new_job_cards = [
-            {
-                "id": "new-job-001",
-                "title": "Software Engineer",
-                "job_url": "https://example.com/jobs/results/new-job-001-software-engineer",
-                "location": "Mountain View, CA"
-            }
-        ]
-
-        # Configure mock scraper
-        mock_scraper.transform_to_job_model.return_value = JobListing(
-            id="new-job-001",
-            title="Software Engineer",
-            company="google",
-            url="https://example.com/jobs/results/new-job-001",
-            source_id=SourceId.GOOGLE,
-            created_at="2024-01-15T10:30:00Z",
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z"
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.mark.parametrize(
+        "cards, detail_scrape, expected_details",
+        [
+            pytest.param(
+                [{"id": "new-job-001", "title": "Software Engineer",
+                  "job_url": "https://example.com/jobs/results/new-job-001",
+                  "location": "Mountain View, CA"}],
+                False, 0, id="without-details",
+            ),
+            pytest.param(
+                [{"id": "job-001", "title": "Test Job", "job_url": "https://example.com/job"},
+                 {"id": "job-002", "title": "Test Job 2", "job_url": "https://example.com/job-2"}],
+                True, 2, id="with-details",
+            ),
+            pytest.param([], True, 0, id="empty"),
+        ],
+    )
+    async def test_process_new_jobs(
+        self, make_job, in_memory_db, mock_scraper_factory, cards, detail_scrape, expected_details
+    ):
+        """Every new card is inserted; details are fetched only when asked"""
+        mock_scraper = mock_scraper_factory(
+            details={"salary": "$100k"},
+            transform=lambda card: make_job(card["id"], card["title"], card["job_url"]),
         )
 
         result = await process_new_jobs(
-            mock_scraper, in_memory_db, new_job_cards, detail_scrape=False
+            mock_scraper, in_memory_db, cards, detail_scrape=detail_scrape
         )
 
-        # Verify job was inserted
-        job = db.get_job_by_id(in_memory_db, SourceId.GOOGLE, "new-job-001")
-        assert job is not None
-        assert job["title"] == "Software Engineer"
-
-    @pytest.mark.asyncio
-    async def test_process_new_jobs_with_details(self, in_memory_db, mock_scraper):
-        """Details fetched when detail_scrape=True"""
-        new_job_cards = [
-            {"id": "job-001", "title": "Test Job", "job_url": "https://example.com/job"}
-        ]
+        assert result == expected_details
+        # The scraper owns detail-fetch pacing/concurrency, so every new card
+        # must reach it in a single call — never one call per card.
+        assert mock_scraper.streaming_calls == ([cards] if detail_scrape and cards else [])
+        assert mock_scraper.transform_calls == len(cards)
 
-        # Mock scrape_job_details_streaming as an async generator
-        async def mock_streaming(job_cards):
-            for job in job_cards:
-                yield {"id": "job-001", "title": "Test Job", "job_url": "https://example.com/job", "salary": "$100k"}
-
-        mock_scraper.scrape_job_details_streaming = mock_streaming
-        mock_scraper.transform_to_job_model.return_value = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="google",
-            url="https://example.com/job",
-            source_id=SourceId.GOOGLE,
-            created_at="2024-01-15T10:30:00Z",
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z"
-        )
+        jobs = db.get_jobs_by_ids(in_memory_db, SourceId.GOOGLE, [c["id"] for c in cards])
+        assert {job_id: job["title"] for job_id, job in jobs.items()} == {
+            c["id"]: c["title"] for c in cards
+        }
 
-        result = await process_new_jobs(
-            mock_scraper, in_memory_db, new_job_cards, detail_scrape=True
+    @pytest.mark.parametrize("batch_size", [1, 10, 50, 500])
+    async def test_process_new_jobs_batch_size_sweep(
+        self, make_job, in_memory_db, mock_scraper_factory, batch_size
+    ):
+        """Every card lands for any batch_size, in ceil(n / batch_size) multi-row writes"""
+        total = 200
+        cards = [
+            {"id": f"job-{i}", "title": f"Job {i}", "job_url": f"https://example.com/job-{i}"}
+            for i in range(total)
+        ]
+        mock_scraper = mock_scraper_factory(
+            transform=lambda card: make_job(card["id"], card["title"], card["job_url"])
         )
 
-        # Should have yielded 1 enriched job
-        assert result == 1  # 1 detail fetched
+        with patch(
+            "shared.batch_writer.db.upsert_jobs_batch", wraps=db.upsert_jobs_batch
+        ) as upsert:
+            await process_new_jobs(
+                mock_scraper, in_memory_db, cards, detail_scrape=False, batch_size=batch_size
+            )
 
-    @pytest.mark.asyncio
-    async def test_process_new_jobs_without_details(self, in_memory_db, mock_scraper):
-        """Details skipped when detail_scrape=False"""
-        new_job_cards = [
-            {"id": "job-001", "title": "Test Job", "job_url": "https://example.com/job"}
-        ]
+        assert db.count_active_jobs(in_memory_db, SourceId.GOOGLE, "google") == total
+        # One write per full buffer plus the final flush — never one per row
+        # unless batch_size asks for it.
+        assert upsert.call_count == -(-total // batch_size)
 
-        # Track whether streaming was called
-        streaming_called = False
-
-        async def mock_streaming(job_cards):
-            nonlocal streaming_called
-            streaming_called = True
-            for job in job_cards:
-                yield job
-
-        mock_scraper.scrape_job_details_streaming = mock_streaming
-        mock_scraper.transform_to_job_model.return_value = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="google",
-            url="https://example.com/job",
-            source_id=SourceId.GOOGLE,
-            created_at="2024-01-15T10:30:00Z",
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z"
-        )
+    async def test_process_new_jobs_empty_does_no_work(self, mock_scraper):
+        """Empty input returns before building a writer or touching the DB"""
+        db_conn = MagicMock()
 
-        result = await process_new_jobs(
-            mock_scraper, in_memory_db, new_job_cards, detail_scrape=False
-        )
-
-        # Should NOT have called scrape_job_details_streaming when detail_scrape=False
-        assert not streaming_called
-        assert result == 0  # 0 details fetched
+        with patch("shared.incremental.BatchWriter") as writer_cls:
+            result = await process_new_jobs(mock_scraper, db_conn, [], detail_scrape=True)
 
-    @pytest.mark.asyncio
-    async def test_process_new_jobs_empty(self, in_memory_db, mock_scraper):
-        """Returns 0 for empty job list"""
-        result = await process_new_jobs(
-            mock_scraper, in_memory_db, [], detail_scrape=True
-        )
         assert result == 0
+        writer_cls.assert_not_called()
+        db_conn.cursor.assert_not_called()
 
 
 class TestUpdateExistingJobs:
     """Tests for update_existing_jobs function"""
 
-    def test_update_existing_jobs_active(self, in_memory_db, sample_job_listing):
-        """Active jobs get last_seen updated"""
-        db.insert_job(in_memory_db, sample_job_listing)
-
-        still_active_ids = {sample_job_listing.id}
-        missing_ids = set()
-
-        closed_count = update_existing_jobs(
-            in_memory_db, SourceId.GOOGLE, still_active_ids, missing_ids
-        )
-
-        # Verify last_seen updated and misses reset
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
-        assert job["consecutive_misses"] == 0
-        assert closed_count == 0
-
-    def test_update_existing_jobs_missing_increment(self, in_memory_db, sample_job_listing):
-        """Missing jobs get misses incremented but not closed until threshold"""
-        db.insert_job(in_memory_db, sample_job_listing)
-
-        still_active_ids = set()
-        missing_ids = {sample_job_listing.id}
-
-        closed_count = update_existing_jobs(
-            in_memory_db, SourceId.GOOGLE, still_active_ids, missing_ids
-        )
-
-        # After first miss: consecutive_misses becomes 1, threshold is 2, so not closed yet
-        job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
-        assert job["consecutive_misses"] == 1
-        assert job["status"] == "OPEN"
-        assert closed_count == 0
-
-    def test_update_existing_jobs_closes_at_threshold(self, in_memory_db, sample_job_listing):
-        """Jobs closed when misses >= threshold (2)"""
+    @pytest.mark.parametrize(
+        "prior_misses, seen, expected_misses, expected_status, expected_closed",
+        [
+            # Still in results: misses reset, stays open
+            (0, True, 0, "OPEN", 0),
+            # First miss: counted, but threshold (2) not reached yet
+            (0, False, 1, "OPEN", 0),
+            # Second consecutive miss reaches the threshold and closes
+            (1, False, MISSED_RUN_THRESHOLD, "CLOSED", 1),
+        ],
+        ids=["active", "missing_increment", "closes_at_threshold"],
+    )
+    def test_update_existing_jobs_single(
+        self, in_memory_db, sample_job_listing,
+        prior_misses, seen, expected_misses, expected_status, expected_closed,
+    ):
+        """One job, seen or missing, against the default miss threshold"""
         db.insert_job(in_memory_db, sample_job_listing)
-        # Start with 1 miss — accrued via the real increment path, since the
+        # Prior misses accrue via the real increment path, since the
         # job_freshness sidecar is trigger-seeded at 0 (not from the model).
-        db.increment_consecutive_misses(
-            in_memory_db, sample_job_listing.source_id, [sample_job_listing.id]
-        )
-
-        still_active_ids = set()
-        missing_ids = {sample_job_listing.id}
+        for _ in range(prior_misses):
+            db.increment_consecutive_misses(
+                in_memory_db, sample_job_listing.source_id, [sample_job_listing.id]
+            )
 
+        job_ids = {sample_job_listing.id}
         closed_count = update_existing_jobs(
             in_memory_db,
             SourceId.GOOGLE,
-            still_active_ids,
-            missing_ids,
+            job_ids if seen else set(),
+            set() if seen else job_ids,
             threshold=MISSED_RUN_THRESHOLD,
         )
 
-        # After second miss (total 2), should be closed
         job = db.get_job_by_id(in_memory_db, sample_job_listing.source_id, sample_job_listing.id)
-        assert job["status"] == "CLOSED"
-        assert closed_count == 1
+        assert job["consecutive_misses"] == expected_misses
+        assert job["status"] == expected_status
+        assert closed_count == expected_closed
 
     def test_update_existing_jobs_mixed(self, in_memory_db, multiple_job_listings):
         """Handles mix of active and missing jobs"""
-        for job in multiple_job_listings:
-            db.insert_job(in_memory_db, job)
+        db.insert_jobs_batch(in_memory_db, multiple_job_listings)
 
         still_active_ids = {"job-000"}  # One still active
         missing_ids = {"job-001", "job-002"}  # Two missing
@@ -213,14 +180,24 @@ class TestUpdateExistingJobs:
             in_memory_db, SourceId.GOOGLE, still_active_ids, missing_ids
         )
 
+        rows = db.get_jobs_by_ids(
+            in_memory_db, SourceId.GOOGLE, still_active_ids | missing_ids
+        )
+
         # Active job should have misses reset
-        job = db.get_job_by_id(in_memory_db, SourceId.GOOGLE, "job-000")
-        assert job["consecutive_misses"] == 0
+        assert rows["job-000"]["consecutive_misses"] == 0
 
         # Missing jobs should have misses incremented
-        for job_id in missing_ids:
-            job = db.get_job_by_id(in_memory_db, SourceId.GOOGLE, job_id)
-            assert job["consecutive_misses"] == 1
+        assert {rows[job_id]["consecutive_misses"] for job_id in missing_ids} == {1}
+
+    def test_update_existing_jobs_nothing_to_update(self):
+        """No active and no missing ids: returns 0 without a DB round trip"""
+        db_conn = MagicMock()
+
+        closed_count = update_existing_jobs(db_conn, SourceId.GOOGLE, set(), set())
+
+        assert closed_count == 0
+        db_conn.cursor.assert_not_called()
 
     def test_update_existing_jobs_rejects_empty_source_id(self, in_memory_db):
         """Highest-level fail-fast guard: empty source_id raises before any
@@ -234,37 +211,26 @@ class TestUpdateExistingJobs:
 class TestRunIncrementalScrape:
     """Tests for run_incremental_scrape function (full 5-phase algorithm)"""
 
-    @pytest.mark.asyncio
-    async def test_run_incremental_scrape_full_flow(self, in_memory_db, mock_scraper):
+    pytestmark = pytest.mark.asyncio
+
+    async def test_run_incremental_scrape_full_flow(self, make_job, in_memory_db, mock_scraper_factory):
         """Complete 5-phase algorithm"""
         # Setup: Insert existing jobs
-        existing_job = JobListing(
-            id="existing-001",
-            title="Existing Job",
-            company="google",
-            url="https://example.com/existing",
-            source_id=SourceId.GOOGLE,
-            created_at="2024-01-10T10:00:00Z",
-            first_seen_at="2024-01-10T10:00:00Z",
-            last_seen_at="2024-01-10T10:00:00Z"
+        existing_job = make_job(
+            "existing-001",
+            "Existing Job",
+            "https://example.com/existing",
+            seen_at=_EXISTING_JOB_TS,
         )
         db.insert_job(in_memory_db, existing_job)
 
         # Mock scraper returns one existing and one new job
-        mock_scraper.scrape_all_queries = AsyncMock(return_value=[
-            {"id": "existing-001", "title": "Existing Job", "job_url": "https://example.com/existing"},
-            {"id": "new-001", "title": "New Job", "job_url": "https://example.com/new"}
-        ])
-
-        mock_scraper.transform_to_job_model.return_value = JobListing(
-            id="new-001",
-            title="New Job",
-            company="google",
-            url="https://example.com/new",
-            source_id=SourceId.GOOGLE,
-            created_at="2024-01-15T10:30:00Z",
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z"
+        mock_scraper = mock_scraper_factory(
+            cards=[
+                {"id": "existing-001", "title": "Existing Job", "job_url": "https://example.com/existing"},
+                {"id": "new-001", "title": "New Job", "job_url": "https://example.com/new"}
+            ],
+            transform=make_job("new-001", "New Job", "https://example.com/new"),
         )
 
         result = await run_incremental_scrape(
@@ -276,45 +242,47 @@ class TestRunIncrementalScrape:
         assert result.jobs_seen == 2
         assert result.new_jobs == 1
 
-    @pytest.mark.asyncio
+        # Verify final DB state in one round trip
+        rows = db.get_jobs_by_ids(in_memory_db, SourceId.GOOGLE, ["existing-001", "new-001"])
+        assert {job_id: row["status"] for job_id, row in rows.items()} == {
+            "existing-001": "OPEN",
+            "new-001": "OPEN",
+        }
+        assert rows["existing-001"]["consecutive_misses"] == 0
+
     async def test_run_incremental_scrape_records_run(self, in_memory_db, mock_scraper):
         """ScrapeRun recorded in database"""
-        mock_scraper.scrape_all_queries = AsyncMock(return_value=[])
-
         result = await run_incremental_scrape(
             mock_scraper, in_memory_db, company="google", detail_scrape=False
         )
 
         # Verify scrape run recorded
         cursor = in_memory_db.cursor()
-        cursor.execute("SELECT * FROM scrape_runs WHERE run_id = %s", (result.run_id,))
+        cursor.execute(
+            "SELECT company, mode FROM scrape_runs WHERE run_id = %s",
+            (result.run_id,)
+        )
         row = cursor.fetchone()
 
         assert row is not None
-        assert dict(row)["company"] == "google"
-        assert dict(row)["mode"] == "incremental"
+        assert row["company"] == "google"
+        assert row["mode"] == "incremental"
 
-    @pytest.mark.asyncio
-    async def test_run_incremental_scrape_empty_scrape_skips_closure(self, in_memory_db, mock_scraper):
+    async def test_run_incremental_scrape_empty_scrape_skips_closure(self, make_job, in_memory_db, mock_scraper):
         """Empty scrape with active jobs in DB triggers safety guard - jobs NOT closed"""
         # Insert job that would normally be closed on 2nd miss
-        existing_job = JobListing(
-            id="will-be-closed",
-            title="Closing Job",
-            company="google",
-            url="https://example.com/closing",
-            source_id=SourceId.GOOGLE,
-            created_at="2024-01-10T10:00:00Z",
-            first_seen_at="2024-01-10T10:00:00Z",
-            last_seen_at="2024-01-10T10:00:00Z",
+        existing_job = make_job(
+            "will-be-closed",
+            "Closing Job",
+            "https://example.com/closing",
+            seen_at=_EXISTING_JOB_TS,
         )
         db.insert_job(in_memory_db, existing_job)
         # Already missed once — established via the real increment path, since
         # the job_freshness sidecar is trigger-seeded at 0 (model field ignored).
         db.increment_consecutive_misses(in_memory_db, SourceId.GOOGLE, ["will-be-closed"])
 
-        # Mock scraper returns empty (simulates scraper failure)
-        mock_scraper.scrape_all_queries = AsyncMock(return_value=[])
+        # mock_scraper returns no cards by default (simulates scraper failure)
 
         result = await run_incremental_scrape(
             mock_scraper, in_memory_db, company="google", detail_scrape=False
@@ -327,37 +295,27 @@ class TestRunIncrementalScrape:
         assert result.closed_jobs == 0
         assert result.skipped_update is True
 
-    @pytest.mark.asyncio
-    async def test_run_incremental_scrape_nonempty_scrape_closes_missing(self, in_memory_db, mock_scraper):
+    async def test_run_incremental_scrape_nonempty_scrape_closes_missing(self, make_job, in_memory_db, mock_scraper_factory):
         """Non-empty scrape with missing jobs still closes them normally"""
         # Insert two jobs: one will be seen, one will be missing
-        seen_job = JobListing(
-            id="still-active",
-            title="Active Job",
-            company="google",
-            url="https://example.com/active",
-            source_id=SourceId.GOOGLE,
-            created_at="2024-01-10T10:00:00Z",
-            first_seen_at="2024-01-10T10:00:00Z",
-            last_seen_at="2024-01-10T10:00:00Z",
+        seen_job = make_job(
+            "still-active",
+            "Active Job",
+            "https://example.com/active",
+            seen_at=_EXISTING_JOB_TS,
         )
-        missing_job = JobListing(
-            id="will-be-closed",
-            title="Closing Job",
-            company="google",
-            url="https://example.com/closing",
-            source_id=SourceId.GOOGLE,
-            created_at="2024-01-10T10:00:00Z",
-            first_seen_at="2024-01-10T10:00:00Z",
-            last_seen_at="2024-01-10T10:00:00Z",
+        missing_job = make_job(
+            "will-be-closed",
+            "Closing Job",
+            "https://example.com/closing",
+            seen_at=_EXISTING_JOB_TS,
         )
-        db.insert_job(in_memory_db, seen_job)
-        db.insert_job(in_memory_db, missing_job)
+        db.insert_jobs_batch(in_memory_db, [seen_job, missing_job])
         # Already missed once — via the real increment path (sidecar seeded at 0).
         db.increment_consecutive_misses(in_memory_db, SourceId.GOOGLE, ["will-be-closed"])
 
         # Scraper returns only the active job (missing_job is absent)
-        mock_scraper.scrape_all_queries = AsyncMock(return_value=[
+        mock_scraper = mock_scraper_factory(cards=[
             {"id": "still-active", "title": "Active Job", "job_url": "https://example.com/active"},
         ])
 
@@ -371,11 +329,9 @@ class TestRunIncrementalScrape:
         assert result.closed_jobs == 1
         assert result.skipped_update is False
 
-    @pytest.mark.asyncio
     async def test_run_incremental_scrape_empty_scrape_empty_db(self, in_memory_db, mock_scraper):
         """Empty scrape with empty DB does not trigger safety guard"""
-        # No jobs in database
-        mock_scraper.scrape_all_queries = AsyncMock(return_value=[])
+        # No jobs in database; mock_scraper returns no cards by default
 
         result = await run_incremental_scrape(
             mock_scraper, in_memory_db, company="google", detail_scrape=False
@@ -385,23 +341,19 @@ class TestRunIncrementalScrape:
         assert result.skipped_update is False
         assert result.closed_jobs == 0
 
-    @pytest.mark.asyncio
-    async def test_partial_scrape_triggers_safety_guard(self, in_memory_db, mock_scraper):
+    async def test_partial_scrape_triggers_safety_guard(self, make_job, in_memory_db, mock_scraper):
         """Scraper returning fewer jobs than SAFETY_GUARD_RATIO triggers guard"""
         # Insert 100 jobs in DB
-        for i in range(100):
-            job = JobListing(
-                id=f"job-{i}",
-                title=f"Job {i}",
-                company="google",
-                url=f"https://example.com/job-{i}",
-                source_id=SourceId.GOOGLE,
-                created_at="2024-01-10T10:00:00Z",
-                first_seen_at="2024-01-10T10:00:00Z",
-                last_seen_at="2024-01-10T10:00:00Z",
+        db.insert_jobs_batch(in_memory_db, [
+            make_job(
+                f"job-{i}",
+                f"Job {i}",
+                f"https://example.com/job-{i}",
+                seen_at=_EXISTING_JOB_TS,
                 consecutive_misses=1,
             )
-            db.insert_job(in_memory_db, job)
+            for i in range(100)
+        ])
 
         # Return 5 jobs (5% < 10% threshold) — simulates crash after first page
         mock_scraper.scrape_all_queries = AsyncMock(return_value=[
@@ -416,8 +368,7 @@ class TestRunIncrementalScrape:
         assert result.skipped_update is True
         assert result.closed_jobs == 0
 
-    @pytest.mark.asyncio
-    async def test_scrape_at_threshold_now_trips_the_partial_guard(self, in_memory_db, mock_scraper):
+    async def test_scrape_at_threshold_now_trips_the_partial_guard(self, make_job, in_memory_db, mock_scraper):
         """SEMANTIC CHANGE (was ``test_scrape_at_threshold_does_not_trigger_guard``).
 
         10-of-100 sits exactly ON the legacy ``SAFETY_GUARD_RATIO`` (0.1)
@@ -437,19 +388,16 @@ class TestRunIncrementalScrape:
         rather than ``empty_scrape``.
         """
         # Insert 100 jobs in DB
-        for i in range(100):
-            job = JobListing(
-                id=f"job-{i}",
-                title=f"Job {i}",
-                company="google",
-                url=f"https://example.com/job-{i}",
-                source_id=SourceId.GOOGLE,
-                created_at="2024-01-10T10:00:00Z",
-                first_seen_at="2024-01-10T10:00:00Z",
-                last_seen_at="2024-01-10T10:00:00Z",
+        db.insert_jobs_batch(in_memory_db, [
+            make_job(
+                f"job-{i}",
+                f"Job {i}",
+                f"https://example.com/job-{i}",
+                seen_at=_EXISTING_JOB_TS,
                 consecutive_misses=1,
             )
-            db.insert_job(in_memory_db, job)
+            for i in range(100)
+        ])
 
         # Return 10 jobs (exactly 10% — rule (a) is `<` so it does NOT fire,
         # but rule (b) does).
@@ -466,9 +414,8 @@ class TestRunIncrementalScrape:
         assert result.closed_jobs == 0
         assert result.error_count == 1
 
-    @pytest.mark.asyncio
     async def test_apple_style_partial_scrape_does_not_increment_misses(
-        self, in_memory_db, mock_scraper
+        self, make_job, in_memory_db, mock_scraper
     ):
         """THE regression test for this whole change.
 
@@ -489,28 +436,18 @@ class TestRunIncrementalScrape:
         returned = 2585
 
         jobs = [
-            JobListing(
-                id=f"apple-{i}",
-                title=f"Job {i}",
+            make_job(
+                f"apple-{i}",
+                f"Job {i}",
+                f"https://example.com/apple-{i}",
+                seen_at=_EXISTING_JOB_TS,
                 company="apple",
-                url=f"https://example.com/apple-{i}",
-                source_id=SourceId.GOOGLE,
-                created_at="2024-01-10T10:00:00Z",
-                first_seen_at="2024-01-10T10:00:00Z",
-                last_seen_at="2024-01-10T10:00:00Z",
-                consecutive_misses=0,
             )
             for i in range(active_total)
         ]
-        # NOTE: don't assert on insert_jobs_batch's return value — it reports
-        # psycopg2's rowcount for the LAST execute_values page only (page_size
-        # =100), so it under-counts any batch over 100. Verify with a COUNT.
-        db.insert_jobs_batch(in_memory_db, jobs)
-        seed_cursor = in_memory_db.cursor()
-        seed_cursor.execute(
-            "SELECT count(*) AS n FROM job_listings WHERE company = 'apple'"
-        )
-        assert seed_cursor.fetchone()['n'] == active_total
+        # insert_jobs_batch counts RETURNING rows across every page, so its
+        # return value is exact even past page_size=100.
+        assert db.insert_jobs_batch(in_memory_db, jobs) == active_total
 
         mock_scraper.scrape_all_queries = AsyncMock(return_value=[
             {"id": f"apple-{i}", "title": f"Job {i}", "job_url": f"https://example.com/apple-{i}"}
@@ -544,9 +481,8 @@ class TestRunIncrementalScrape:
         )
         assert cursor.fetchone()["n"] == active_total
 
-    @pytest.mark.asyncio
     async def test_two_consecutive_partials_close_nothing(
-        self, in_memory_db, mock_scraper
+        self, make_job, in_memory_db, mock_scraper
     ):
         """The literal mass-closure scenario, end to end.
 
@@ -564,28 +500,18 @@ class TestRunIncrementalScrape:
         returned = 200
 
         jobs = [
-            JobListing(
-                id=f"job-{i}",
-                title=f"Job {i}",
+            make_job(
+                f"job-{i}",
+                f"Job {i}",
+                f"https://example.com/job-{i}",
+                seen_at=_EXISTING_JOB_TS,
                 company="apple",
-                url=f"https://example.com/job-{i}",
-                source_id=SourceId.GOOGLE,
-                created_at="2024-01-10T10:00:00Z",
-                first_seen_at="2024-01-10T10:00:00Z",
-                last_seen_at="2024-01-10T10:00:00Z",
-                consecutive_misses=0,
             )
             for i in range(active_total)
         ]
-        # NOTE: don't assert on insert_jobs_batch's return value — it reports
-        # psycopg2's rowcount for the LAST execute_values page only (page_size
-        # =100), so it under-counts any batch over 100. Verify with a COUNT.
-        db.insert_jobs_batch(in_memory_db, jobs)
-        seed_cursor = in_memory_db.cursor()
-        seed_cursor.execute(
-            "SELECT count(*) AS n FROM job_listings WHERE company = 'apple'"
-        )
-        assert seed_cursor.fetchone()['n'] == active_total
+        # insert_jobs_batch counts RETURNING rows across every page, so its
+        # return value is exact even past page_size=100.
+        assert db.insert_jobs_batch(in_memory_db, jobs) == active_total
 
         mock_scraper.scrape_all_queries = AsyncMock(return_value=[
             {"id": f"job-{i}", "title": f"Job {i}", "job_url": f"https://example.com/job-{i}"}
@@ -609,9 +535,8 @@ class TestRunIncrementalScrape:
             f"{closed} jobs mass-closed by two consecutive truncated scrapes"
         )
 
-    @pytest.mark.asyncio
     async def test_guard_trip_is_persisted_on_the_scrape_run_row(
-        self, in_memory_db, mock_scraper
+        self, make_job, in_memory_db, mock_scraper
     ):
         """A tripped guard must be legible in ``scrape_runs`` afterwards.
 
@@ -621,15 +546,12 @@ class TestRunIncrementalScrape:
         truncations sat unnoticed in the table for three weeks.
         """
         jobs = [
-            JobListing(
-                id=f"job-{i}",
-                title=f"Job {i}",
+            make_job(
+                f"job-{i}",
+                f"Job {i}",
+                f"https://example.com/job-{i}",
+                seen_at=_EXISTING_JOB_TS,
                 company="apple",
-                url=f"https://example.com/job-{i}",
-                source_id=SourceId.GOOGLE,
-                created_at="2024-01-10T10:00:00Z",
-                first_seen_at="2024-01-10T10:00:00Z",
-                last_seen_at="2024-01-10T10:00:00Z",
             )
             for i in range(200)
         ]
@@ -658,9 +580,10 @@ class TestRunIncrementalScrape:
 class TestGuardLogRouting:
     """The guard trip must reach Railway's ``@level:error`` filter."""
 
-    @pytest.mark.asyncio
+    pytestmark = pytest.mark.asyncio
+
     async def test_guard_trip_logs_at_error_level(
-        self, in_memory_db, mock_scraper, caplog
+        self, make_job, in_memory_db, mock_scraper, caplog
     ):
         """Must be ERROR, not WARNING.
 
@@ -677,20 +600,16 @@ class TestGuardLogRouting:
         this entire change exists for, was the one silently outside the
         filter.
         """
-        for i in range(200):
-            db.insert_job(
-                in_memory_db,
-                JobListing(
-                    id=f"job-{i}",
-                    title=f"Job {i}",
-                    company="apple",
-                    url=f"https://example.com/job-{i}",
-                    source_id=SourceId.GOOGLE,
-                    created_at="2024-01-10T10:00:00Z",
-                    first_seen_at="2024-01-10T10:00:00Z",
-                    last_seen_at="2024-01-10T10:00:00Z",
-                ),
+        db.insert_jobs_batch(in_memory_db, [
+            make_job(
+                f"job-{i}",
+                f"Job {i}",
+                f"https://example.com/job-{i}",
+                seen_at=_EXISTING_JOB_TS,
+                company="apple",
             )
+            for i in range(200)
+        ])
 
         mock_scraper.scrape_all_queries = AsyncMock(return_value=[
             {"id": f"job-{i}", "title": f"Job {i}", "job_url": f"https://example.com/job-{i}"}
@@ -723,23 +642,24 @@ class TestBoundedAutoReleaseEndToEnd:
     operationally — that a released run still cannot mass-close anything.
     """
 
-    @staticmethod
-    def _seed(in_memory_db, total, company="apple"):
-        jobs = [
-            JobListing(
-                id=f"job-{i}",
-                title=f"Job {i}",
-                company=company,
-                url=f"https://example.com/job-{i}",
-                source_id=SourceId.GOOGLE,
-                created_at="2024-01-10T10:00:00Z",
-                first_seen_at="2024-01-10T10:00:00Z",
-                last_seen_at="2024-01-10T10:00:00Z",
-                consecutive_misses=0,
-            )
-            for i in range(total)
-        ]
-        db.insert_jobs_batch(in_memory_db, jobs)
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.fixture
+    def seed_jobs(self, in_memory_db, make_job):
+        """Insert ``total`` existing jobs job-0..job-{total-1} for ``company``"""
+        def _seed(total, company="apple"):
+            jobs = [
+                make_job(
+                    f"job-{i}",
+                    f"Job {i}",
+                    f"https://example.com/job-{i}",
+                    seen_at=_EXISTING_JOB_TS,
+                    company=company,
+                )
+                for i in range(total)
+            ]
+            db.insert_jobs_batch(in_memory_db, jobs)
+        return _seed
 
     @staticmethod
     def _cards(returned):
@@ -748,9 +668,8 @@ class TestBoundedAutoReleaseEndToEnd:
             for i in range(returned)
         ]
 
-    @pytest.mark.asyncio
     async def test_permanent_shrink_releases_after_n_consecutive_skips(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """The reviewer's scenario: a company permanently cuts its board
         from 200 to 150 and keeps returning 150 forever.
@@ -760,7 +679,7 @@ class TestBoundedAutoReleaseEndToEnd:
         reconcile — otherwise the company is frozen out of ingestion and
         lifecycle indefinitely, which is what shipped before this fix.
         """
-        self._seed(in_memory_db, 200)
+        seed_jobs(200)
         mock_scraper.scrape_all_queries = AsyncMock(return_value=self._cards(150))
 
         skipped_flags = []
@@ -778,9 +697,8 @@ class TestBoundedAutoReleaseEndToEnd:
             "without this the company is frozen forever"
         )
 
-    @pytest.mark.asyncio
     async def test_a_single_released_run_closes_nothing_on_a_pristine_board(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """Baseline (weak) case: no job carries prior miss evidence.
 
@@ -789,7 +707,7 @@ class TestBoundedAutoReleaseEndToEnd:
         already at misses=1; that is what exposed the original
         "can never close anything" claim as false.
         """
-        self._seed(in_memory_db, 200)
+        seed_jobs(200)
         mock_scraper.scrape_all_queries = AsyncMock(return_value=self._cards(150))
 
         for _ in range(SCRAPER_GUARD_MAX_CONSECUTIVE_SKIPS + 1):
@@ -813,9 +731,8 @@ class TestBoundedAutoReleaseEndToEnd:
         )
         assert cursor.fetchone()["m"] == 1
 
-    @pytest.mark.asyncio
     async def test_released_run_closes_nothing_when_jobs_carry_prior_misses(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """FALSIFICATION TEST — this is the one that matters.
 
@@ -832,7 +749,7 @@ class TestBoundedAutoReleaseEndToEnd:
         closed all 130 live jobs. It must close zero.
         """
         total, hiccup, truncated = 1000, 870, 500
-        self._seed(in_memory_db, total)
+        seed_jobs(total)
 
         # Run 1: sub-threshold hiccup. 870/1000 = 87% > 85%, and this is
         # exactly the shape the guard is designed NOT to catch.
@@ -878,9 +795,8 @@ class TestBoundedAutoReleaseEndToEnd:
             "RELEASED_RUN_MISS_THRESHOLD, not MISSED_RUN_THRESHOLD."
         )
 
-    @pytest.mark.asyncio
     async def test_two_release_cycles_do_reconcile_a_permanent_shrink(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """The stricter released-run threshold must not break liveness.
 
@@ -890,7 +806,7 @@ class TestBoundedAutoReleaseEndToEnd:
         reach RELEASED_RUN_MISS_THRESHOLD and asserts the vanished jobs do
         finally close.
         """
-        self._seed(in_memory_db, 200)
+        seed_jobs(200)
         mock_scraper.scrape_all_queries = AsyncMock(return_value=self._cards(150))
 
         releases = 0
@@ -916,9 +832,8 @@ class TestBoundedAutoReleaseEndToEnd:
             "now so strict it has become the freeze it was meant to fix"
         )
 
-    @pytest.mark.asyncio
     async def test_released_run_can_close_an_anomalous_row(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """Pins the ONE gap in the safety argument, honestly.
 
@@ -934,7 +849,7 @@ class TestBoundedAutoReleaseEndToEnd:
         stays honest, and so anyone who later claims blanket immunity has to
         confront this test.
         """
-        self._seed(in_memory_db, 200)
+        seed_jobs(200)
         cursor = in_memory_db.cursor()
         # Seed the anomaly in the sidecar — the only store there is: the
         # close path reads it, and job_listings has carried no
@@ -960,9 +875,8 @@ class TestBoundedAutoReleaseEndToEnd:
         )
         assert cursor.fetchone()["status"] == "CLOSED"
 
-    @pytest.mark.asyncio
     async def test_empty_scrape_skips_do_not_earn_a_release(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """FALSIFICATION TEST — rule (a) must not feed the rule (b) counter.
 
@@ -976,7 +890,7 @@ class TestBoundedAutoReleaseEndToEnd:
         Three empty scrapes, then one truncated run: the truncated run must
         still latch.
         """
-        self._seed(in_memory_db, 200)
+        seed_jobs(200)
 
         mock_scraper.scrape_all_queries = AsyncMock(return_value=[])
         for _ in range(SCRAPER_GUARD_MAX_CONSECUTIVE_SKIPS):
@@ -997,15 +911,14 @@ class TestBoundedAutoReleaseEndToEnd:
         )
         assert result.guard_reason == "partial_scrape"
 
-    @pytest.mark.asyncio
     async def test_alternating_outage_and_truncation_never_releases(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """The reviewer's 'Regime I': 0, 0, 0, 150 repeating, with no real
         shrink anywhere. Counting the boolean, run 8 closed 50 of 200. With
         the streak counted on partial_scrape only, nothing may ever close —
         no two partial runs are ever consecutive."""
-        self._seed(in_memory_db, 200)
+        seed_jobs(200)
 
         empty = AsyncMock(return_value=[])
         truncated = AsyncMock(return_value=self._cards(150))
@@ -1025,9 +938,8 @@ class TestBoundedAutoReleaseEndToEnd:
         )
         assert cursor.fetchone()["n"] == 0
 
-    @pytest.mark.asyncio
     async def test_a_healthy_run_resets_the_streak(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """A transient truncation must NOT accumulate toward a release.
 
@@ -1036,7 +948,7 @@ class TestBoundedAutoReleaseEndToEnd:
         the release must not fire on: an intermittent scraper, not a real
         shrink.
         """
-        self._seed(in_memory_db, 200)
+        seed_jobs(200)
 
         truncated = AsyncMock(return_value=self._cards(150))
         healthy = AsyncMock(return_value=self._cards(200))
@@ -1054,9 +966,8 @@ class TestBoundedAutoReleaseEndToEnd:
             "streak; otherwise a flaky scraper eventually earns a release"
         )
 
-    @pytest.mark.asyncio
     async def test_null_skipped_update_rows_do_not_count_toward_release(
-        self, in_memory_db, mock_scraper
+        self, seed_jobs, in_memory_db, mock_scraper
     ):
         """Pre-column rows are NULL = "unknown", and an unknown must never
         be counted as evidence for releasing a destructive guard.
@@ -1065,7 +976,7 @@ class TestBoundedAutoReleaseEndToEnd:
         every row written before migration ae99a1939dc1 looks like) and
         asserts the very next truncated run still latches.
         """
-        self._seed(in_memory_db, 200)
+        seed_jobs(200)
 
         cursor = in_memory_db.cursor()
         for i in range(SCRAPER_GUARD_MAX_CONSECUTIVE_SKIPS + 2):
@@ -1083,11 +994,10 @@ class TestBoundedAutoReleaseEndToEnd:
 
         assert result.skipped_update is True
 
-    @pytest.mark.asyncio
-    async def test_streak_is_scoped_per_company(self, in_memory_db, mock_scraper):
+    async def test_streak_is_scoped_per_company(self, seed_jobs, in_memory_db, mock_scraper):
         """One company's skips must not release another's guard."""
-        self._seed(in_memory_db, 200, company="apple")
-        self._seed(in_memory_db, 200, company="google")
+        seed_jobs(200, company="apple")
+        seed_jobs(200, company="google")
 
         cursor = in_memory_db.cursor()
         for i in range(SCRAPER_GUARD_MAX_CONSECUTIVE_SKIPS + 2):
@@ -1149,6 +1059,16 @@ class TestScrapeResult:
         assert result.run_id == "custom-run-id"
         assert result.skipped_update is False
 
+    def test_scrape_result_run_ids_are_unique(self):
+        """Each result gets its own run_id"""
+        assert ScrapeResult().run_id != ScrapeResult().run_id
+
+    def test_scrape_result_has_no_instance_dict(self):
+        """slots=True: a typo'd attribute write fails instead of being dropped"""
+        result = ScrapeResult()
+        with pytest.raises(AttributeError):
+            result.closed_job = 1
+
     def test_scrape_result_skipped_update(self):
         """ScrapeResult accepts skipped_update flag"""
         result = ScrapeResult(skipped_update=True)
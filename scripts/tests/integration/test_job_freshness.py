@@ -14,36 +14,31 @@ The trigger is installed in the test schema by the ``create_all`` DDL events in
 migration bodies), so this exercises behavior identical to the prod migration.
 """
 
-import sys
 from datetime import datetime, timezone
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import pytest
 
 from shared.constants import SourceId
 from shared.models import JobListing
 from shared import database as db
 
 
-def _make_job(job_id: str, *, first_seen: str, last_seen: str, misses: int) -> JobListing:
+@pytest.fixture
+def make_job(make_job_listing):
     """A minimal valid listing with independently-set freshness fields."""
-    return JobListing(
-        id=job_id,
-        title=f"Engineer {job_id}",
-        company="google",
-        location="Mountain View, CA, USA",
-        url=f"https://example.com/{job_id}",
-        source_id=SourceId.GOOGLE,
-        details={},
-        created_at=first_seen,
-        status="OPEN",
-        has_matched=False,
-        ai_metadata={},
-        first_seen_at=first_seen,
-        last_seen_at=last_seen,
-        consecutive_misses=misses,
-        details_scraped=True,
-    )
+    def _make(job_id: str, *, first_seen: str, last_seen: str, misses: int) -> JobListing:
+        return make_job_listing(
+            job_id,
+            title=f"Engineer {job_id}",
+            location="Mountain View, CA, USA",
+            url=f"https://example.com/{job_id}",
+            created_at=first_seen,
+            first_seen_at=first_seen,
+            last_seen_at=last_seen,
+            consecutive_misses=misses,
+            details_scraped=True,
+        )
+    return _make
 
 
 def _freshness_row(conn, source_id: str, job_id: str):
@@ -97,7 +92,7 @@ def _listings_freshness_columns(conn) -> set:
 
 
 class TestFreshnessTrigger:
-    def test_trigger_seeds_from_first_seen_at_not_last_seen(self, in_memory_db):
+    def test_trigger_seeds_from_first_seen_at_not_last_seen(self, make_job, in_memory_db):
         """The trigger seeds last_seen_at from NEW.first_seen_at and misses from 0.
 
         Uses a listing whose model-level last_seen_at (2024-06-01) and
@@ -105,7 +100,7 @@ class TestFreshnessTrigger:
         pins the exact seed contract — the one that had to keep working once the
         Unit 4 contract migration dropped those columns from job_listings.
         """
-        job = _make_job(
+        job = make_job(
             "seed-1",
             first_seen="2024-01-15T10:30:00Z",
             last_seen="2024-06-01T00:00:00Z",
@@ -118,7 +113,7 @@ class TestFreshnessTrigger:
         assert row["consecutive_misses"] == 0
         assert row["last_seen_at"] == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
 
-    def test_reupsert_advances_freshness_to_scrape_time(self, in_memory_db):
+    def test_reupsert_advances_freshness_to_scrape_time(self, make_job, in_memory_db):
         """Unit 2: re-upserting an existing listing advances its sidecar
         ``last_seen_at`` to the scrape's timestamp and resets
         ``consecutive_misses`` to 0.
@@ -130,7 +125,7 @@ class TestFreshnessTrigger:
         trigger's ``first_seen_at`` seed, and the re-upsert must NOT duplicate
         the freshness row.
         """
-        job = _make_job(
+        job = make_job(
             "reup-1", first_seen="2024-01-15T10:30:00Z", last_seen="2024-01-15T10:30:00Z", misses=0
         )
         db.insert_job(in_memory_db, job)
@@ -145,7 +140,7 @@ class TestFreshnessTrigger:
         in_memory_db.commit()
 
         # A later scrape re-sees the job: upsert with a fresher last_seen_at.
-        reseen = _make_job(
+        reseen = make_job(
             "reup-1", first_seen="2024-01-15T10:30:00Z", last_seen="2024-10-01T09:00:00Z", misses=0
         )
         db.upsert_jobs_batch(in_memory_db, [reseen])
@@ -205,9 +200,9 @@ class TestFreshnessTrigger:
         assert _listings_missing_freshness(in_memory_db) == 0
         assert _orphan_freshness(in_memory_db) == 0
 
-    def test_conflicting_insert_does_not_duplicate_freshness(self, in_memory_db):
+    def test_conflicting_insert_does_not_duplicate_freshness(self, make_job, in_memory_db):
         """A DO NOTHING conflict re-inserting an existing listing keeps one row."""
-        job = _make_job(
+        job = make_job(
             "dup-1", first_seen="2024-01-15T10:30:00Z", last_seen="2024-01-15T10:30:00Z", misses=0
         )
         db.insert_job(in_memory_db, job)
@@ -233,7 +228,7 @@ class TestFreshnessInvariants:
         assert _listings_missing_freshness(in_memory_db) == 0
         assert _orphan_freshness(in_memory_db) == 0
 
-    def test_full_scrape_cycle_keeps_both_anti_joins_zero(self, in_memory_db):
+    def test_full_scrape_cycle_keeps_both_anti_joins_zero(self, make_job, in_memory_db):
         """Both anti-joins stay 0 across an entire simulated scrape cycle.
 
         The tests above each exercise ONE write path in isolation. Drift,
@@ -260,7 +255,7 @@ class TestFreshnessInvariants:
 
         # --- Prior state: two listings already known from an earlier cycle.
         prior = [
-            _make_job(f"cycle-prior-{i}", first_seen="2024-01-01T00:00:00Z",
+            make_job(f"cycle-prior-{i}", first_seen="2024-01-01T00:00:00Z",
                       last_seen="2024-01-01T00:00:00Z", misses=0)
             for i in range(2)
         ]
@@ -271,9 +266,9 @@ class TestFreshnessInvariants:
         #     and re-sees one of the prior ones (ON CONFLICT + _upsert_freshness).
         now = "2024-02-01T06:00:00Z"
         discovered = [
-            _make_job("cycle-new-0", first_seen=now, last_seen=now, misses=0),
-            _make_job("cycle-new-1", first_seen=now, last_seen=now, misses=0),
-            _make_job("cycle-prior-0", first_seen="2024-01-01T00:00:00Z",
+            make_job("cycle-new-0", first_seen=now, last_seen=now, misses=0),
+            make_job("cycle-new-1", first_seen=now, last_seen=now, misses=0),
+            make_job("cycle-prior-0", first_seen="2024-01-01T00:00:00Z",
                       last_seen=now, misses=0),
         ]
         db.upsert_jobs_batch(in_memory_db, discovered)
@@ -317,8 +312,8 @@ class TestFreshnessInvariants:
 
 
 class TestFreshnessCascade:
-    def test_delete_listing_cascades_to_freshness(self, in_memory_db):
-        job = _make_job(
+    def test_delete_listing_cascades_to_freshness(self, make_job, in_memory_db):
+        job = make_job(
             "cascade-1", first_seen="2024-01-15T10:30:00Z", last_seen="2024-01-15T10:30:00Z", misses=0
         )
         db.insert_job(in_memory_db, job)
@@ -340,8 +335,8 @@ class TestFreshnessWritePathDecoupled:
     job_listings row (and its indexes) untouched — the decoupling that fixes the
     index-bloat outage."""
 
-    def test_update_last_seen_writes_sidecar_not_listings(self, in_memory_db):
-        job = _make_job(
+    def test_update_last_seen_writes_sidecar_not_listings(self, make_job, in_memory_db):
+        job = make_job(
             "dec-1", first_seen="2024-01-15T10:30:00Z", last_seen="2024-01-15T10:30:00Z", misses=0
         )
         db.insert_job(in_memory_db, job)
@@ -358,8 +353,8 @@ class TestFreshnessWritePathDecoupled:
         # per-cycle rewrite of job_listings / idx_job_listings_last_seen.
         assert _listings_freshness_columns(in_memory_db) == set()
 
-    def test_increment_misses_writes_sidecar_not_listings(self, in_memory_db):
-        job = _make_job(
+    def test_increment_misses_writes_sidecar_not_listings(self, make_job, in_memory_db):
+        job = make_job(
             "dec-2", first_seen="2024-01-15T10:30:00Z", last_seen="2024-01-15T10:30:00Z", misses=0
         )
         db.insert_job(in_memory_db, job)
@@ -370,8 +365,34 @@ class TestFreshnessWritePathDecoupled:
         assert sidecar["consecutive_misses"] == 1
         assert _listings_freshness_columns(in_memory_db) == set()
 
-    def test_reactivate_splits_status_and_freshness(self, in_memory_db):
-        job = _make_job(
+    def test_refresh_and_close_jobs_closes_only_missing_rows_at_threshold(self, make_job, in_memory_db):
+        db.insert_jobs_batch(in_memory_db, [
+            make_job(
+                job_id, first_seen="2024-01-15T10:30:00Z", last_seen="2024-01-15T10:30:00Z", misses=0
+            )
+            for job_id in ("dec-seen", "dec-first-miss", "dec-second-miss")
+        ])
+        db.increment_consecutive_misses(in_memory_db, SourceId.GOOGLE, ["dec-seen", "dec-second-miss"])
+
+        closed_ids = db.refresh_and_close_jobs(
+            in_memory_db, SourceId.GOOGLE, ["dec-seen"], ["dec-first-miss", "dec-second-miss"],
+            "2024-08-20T08:00:00Z", threshold=2,
+        )
+
+        assert closed_ids == ["dec-second-miss"]
+        rows = db.get_jobs_by_ids(
+            in_memory_db, SourceId.GOOGLE, ["dec-seen", "dec-first-miss", "dec-second-miss"]
+        )
+        assert {job_id: (row["status"], row["consecutive_misses"]) for job_id, row in rows.items()} == {
+            "dec-seen": ("OPEN", 0),
+            "dec-first-miss": ("OPEN", 1),
+            "dec-second-miss": ("CLOSED", 2),
+        }
+        assert rows["dec-second-miss"]["closed_on"] is not None
+        assert _listings_freshness_columns(in_memory_db) == set()
+
+    def test_reactivate_splits_status_and_freshness(self, make_job, in_memory_db):
+        job = make_job(
             "dec-3", first_seen="2024-01-15T10:30:00Z", last_seen="2024-01-15T10:30:00Z", misses=0
         )
         db.insert_job(in_memory_db, job)
@@ -5,14 +5,23 @@ Tests scrape_job_details_streaming(), scrape_job_details_batch(), and _establish
 """
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from tenacity import wait_none
 
 from microsoft_jobs_scraper.scraper import MicrosoftJobsScraper
-from microsoft_jobs_scraper.api_client import JobDetailsFetchError
+from microsoft_jobs_scraper.api_client import JobDetailsFetchError, JobDetailsTransientError
+from microsoft_jobs_scraper.config import DETAIL_FETCH_MAX_ATTEMPTS
+
+
+def _returning(value):
+    """Plain coroutine stand-in for a patched fetch that no test inspects.
+
+    Skips AsyncMock's call recording; tests that assert on calls still
+    patch with an AsyncMock.
+    """
+    async def _fetch(*args, **kwargs):
+        return value
+    return _fetch
 
 
 @pytest.fixture
@@ -31,6 +40,17 @@ def mock_context(mock_page):
     return context
 
 
+@pytest.fixture
+def mocked_scraper(mock_context, monkeypatch):
+    """Detail-scrape scraper wired to mock_context, with delay, session and retry backoff mocked"""
+    monkeypatch.setattr("microsoft_jobs_scraper.scraper._DETAIL_FETCH_WAIT", wait_none())
+    scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
+    scraper.context = mock_context
+    scraper._random_delay = AsyncMock()
+    scraper._establish_session = AsyncMock()
+    return scraper
+
+
 @pytest.fixture
 def sample_job_cards():
     """Sample job cards for testing detail fetching"""
@@ -73,20 +93,15 @@ class TestScrapeJobDetailsStreamingCore:
 
     @pytest.mark.asyncio
     async def test_streaming_yields_enriched_jobs(
-        self, mock_context, mock_page, sample_job_cards, sample_api_details
+        self, mocked_scraper, sample_job_cards, sample_api_details
     ):
         """API details merged into job cards"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
-            AsyncMock(return_value=sample_api_details),
+            new=_returning(sample_api_details),
         ):
             results = []
-            async for job in scraper.scrape_job_details_streaming(sample_job_cards[:1]):
+            async for job in mocked_scraper.scrape_job_details_streaming(sample_job_cards[:1]):
                 results.append(job)
 
         assert len(results) == 1
@@ -99,20 +114,15 @@ class TestScrapeJobDetailsStreamingCore:
 
     @pytest.mark.asyncio
     async def test_streaming_yields_one_at_a_time(
-        self, mock_context, mock_page, sample_job_cards, sample_api_details
+        self, mocked_scraper, sample_job_cards, sample_api_details
     ):
         """Yields jobs one at a time"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
-            AsyncMock(return_value=sample_api_details),
+            new=_returning(sample_api_details),
         ):
             count = 0
-            async for job in scraper.scrape_job_details_streaming(sample_job_cards):
+            async for job in mocked_scraper.scrape_job_details_streaming(sample_job_cards):
                 count += 1
                 # Verify each job is yielded
                 assert "id" in job
@@ -122,59 +132,44 @@ class TestScrapeJobDetailsStreamingCore:
 
     @pytest.mark.asyncio
     async def test_streaming_respects_delay(
-        self, mock_context, mock_page, sample_job_cards, sample_api_details
+        self, mocked_scraper, sample_job_cards, sample_api_details
     ):
-        """Calls delay between each job"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
+        """Calls delay between jobs, not after the last one"""
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
-            AsyncMock(return_value=sample_api_details),
+            new=_returning(sample_api_details),
         ):
-            async for _ in scraper.scrape_job_details_streaming(sample_job_cards):
+            async for _ in mocked_scraper.scrape_job_details_streaming(sample_job_cards):
                 pass
 
-        # Delay called for each job (2 jobs = 2 delays)
-        assert scraper._random_delay.call_count == 2
+        # Delay called between jobs only (2 jobs = 1 delay)
+        assert mocked_scraper._random_delay.call_count == 1
 
     @pytest.mark.asyncio
     async def test_streaming_establishes_session(
-        self, mock_context, mock_page, sample_job_cards, sample_api_details
+        self, mocked_scraper, sample_job_cards, sample_api_details
     ):
         """Establishes session before fetching details"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
-            AsyncMock(return_value=sample_api_details),
+            new=_returning(sample_api_details),
         ):
-            async for _ in scraper.scrape_job_details_streaming(sample_job_cards):
+            async for _ in mocked_scraper.scrape_job_details_streaming(sample_job_cards):
                 pass
 
         # _establish_session should be called once at the start
-        scraper._establish_session.assert_called_once()
+        mocked_scraper._establish_session.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_streaming_closes_page(
-        self, mock_context, mock_page, sample_job_cards, sample_api_details
+        self, mocked_scraper, mock_page, sample_job_cards, sample_api_details
     ):
         """Cleanup in finally block closes page"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
-            AsyncMock(return_value=sample_api_details),
+            new=_returning(sample_api_details),
         ):
-            async for _ in scraper.scrape_job_details_streaming(sample_job_cards):
+            async for _ in mocked_scraper.scrape_job_details_streaming(sample_job_cards):
                 pass
 
         mock_page.close.assert_called_once()
@@ -185,14 +180,9 @@ class TestScrapeJobDetailsStreamingErrors:
 
     @pytest.mark.asyncio
     async def test_streaming_missing_id_skips_fetch(
-        self, mock_context, mock_page
+        self, mocked_scraper
     ):
         """Yields original card when ID is missing"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         job_without_id = [
             {
                 "title": "Software Engineer",
@@ -206,7 +196,7 @@ class TestScrapeJobDetailsStreamingErrors:
             AsyncMock(),
         ) as mock_fetch:
             results = []
-            async for job in scraper.scrape_job_details_streaming(job_without_id):
+            async for job in mocked_scraper.scrape_job_details_streaming(job_without_id):
                 results.append(job)
 
         assert len(results) == 1
@@ -216,43 +206,66 @@ class TestScrapeJobDetailsStreamingErrors:
 
     @pytest.mark.asyncio
     async def test_streaming_api_error_sets_flag(
-        self, mock_context, mock_page, sample_job_cards
+        self, mocked_scraper, sample_job_cards
     ):
-        """Sets _detail_fetch_failed on JobDetailsFetchError"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
-        with patch(
-            "microsoft_jobs_scraper.scraper.fetch_job_details",
-            AsyncMock(side_effect=JobDetailsFetchError("API Error")),
-        ):
+        """Sets _detail_fetch_failed once JobDetailsTransientError exhausts the retries"""
+        mock_fetch = AsyncMock(side_effect=JobDetailsTransientError("HTTP 503"))
+        with patch("microsoft_jobs_scraper.scraper.fetch_job_details", mock_fetch):
             results = []
-            async for job in scraper.scrape_job_details_streaming(sample_job_cards[:1]):
+            async for job in mocked_scraper.scrape_job_details_streaming(sample_job_cards[:1]):
                 results.append(job)
 
+        assert mock_fetch.call_count == DETAIL_FETCH_MAX_ATTEMPTS
         assert len(results) == 1
         assert results[0]["_detail_fetch_failed"] is True
         # Original fields still present
         assert results[0]["id"] == "1970393556642428"
 
+    @pytest.mark.asyncio
+    async def test_streaming_permanent_error_not_retried(
+        self, mocked_scraper, sample_job_cards
+    ):
+        """A non-transient JobDetailsFetchError (e.g. 404) is tried once, then flagged"""
+        mock_fetch = AsyncMock(side_effect=JobDetailsFetchError("HTTP 404"))
+        with patch("microsoft_jobs_scraper.scraper.fetch_job_details", mock_fetch):
+            results = []
+            async for job in mocked_scraper.scrape_job_details_streaming(sample_job_cards[:1]):
+                results.append(job)
+
+        assert mock_fetch.call_count == 1
+        assert len(results) == 1
+        assert results[0]["_detail_fetch_failed"] is True
+
+    @pytest.mark.asyncio
+    async def test_streaming_api_error_retries_then_succeeds(
+        self, mocked_scraper, sample_job_cards, sample_api_details
+    ):
+        """A JobDetailsTransientError is retried and the job still gets enriched"""
+        mock_fetch = AsyncMock(side_effect=[
+            JobDetailsTransientError("HTTP 429"),
+            sample_api_details,
+        ])
+        with patch("microsoft_jobs_scraper.scraper.fetch_job_details", mock_fetch):
+            results = []
+            async for job in mocked_scraper.scrape_job_details_streaming(sample_job_cards[:1]):
+                results.append(job)
+
+        assert mock_fetch.call_count == 2
+        assert len(results) == 1
+        assert results[0]["description"] == sample_api_details["description"]
+        assert "_detail_fetch_failed" not in results[0]
+
     @pytest.mark.asyncio
     async def test_streaming_unexpected_error_sets_flag(
-        self, mock_context, mock_page, sample_job_cards
+        self, mocked_scraper, sample_job_cards
     ):
         """Sets _detail_fetch_failed on unexpected error"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
             AsyncMock(side_effect=Exception("Unexpected error")),
         ):
             results = []
-            async for job in scraper.scrape_job_details_streaming(sample_job_cards[:1]):
+            async for job in mocked_scraper.scrape_job_details_streaming(sample_job_cards[:1]):
                 results.append(job)
 
         assert len(results) == 1
@@ -260,24 +273,19 @@ class TestScrapeJobDetailsStreamingErrors:
 
     @pytest.mark.asyncio
     async def test_streaming_continues_after_error(
-        self, mock_context, mock_page, sample_job_cards, sample_api_details
+        self, mocked_scraper, sample_job_cards, sample_api_details
     ):
         """Continues to next job after error"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         # First job fails, second succeeds
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
             AsyncMock(side_effect=[
-                JobDetailsFetchError("API Error"),
+                JobDetailsFetchError("HTTP 404"),
                 sample_api_details,
             ]),
         ):
             results = []
-            async for job in scraper.scrape_job_details_streaming(sample_job_cards):
+            async for job in mocked_scraper.scrape_job_details_streaming(sample_job_cards):
                 results.append(job)
 
         assert len(results) == 2
@@ -293,19 +301,14 @@ class TestScrapeJobDetailsBatch:
 
     @pytest.mark.asyncio
     async def test_batch_returns_list(
-        self, mock_context, mock_page, sample_job_cards, sample_api_details
+        self, mocked_scraper, sample_job_cards, sample_api_details
     ):
         """Returns list of enriched jobs"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
-            AsyncMock(return_value=sample_api_details),
+            new=_returning(sample_api_details),
         ):
-            result = await scraper.scrape_job_details_batch(sample_job_cards)
+            result = await mocked_scraper.scrape_job_details_batch(sample_job_cards)
 
         assert isinstance(result, list)
         assert len(result) == 2
@@ -315,32 +318,23 @@ class TestScrapeJobDetailsBatch:
 
     @pytest.mark.asyncio
     async def test_batch_empty_input(
-        self, mock_context, mock_page
+        self, mocked_scraper
     ):
         """Empty list returns empty"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._establish_session = AsyncMock()
-
-        result = await scraper.scrape_job_details_batch([])
+        result = await mocked_scraper.scrape_job_details_batch([])
 
         assert result == []
 
     @pytest.mark.asyncio
     async def test_batch_closes_page(
-        self, mock_context, mock_page, sample_job_cards, sample_api_details
+        self, mocked_scraper, mock_page, sample_job_cards, sample_api_details
     ):
         """Page closed after batch operation"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=True)
-        scraper.context = mock_context
-        scraper._random_delay = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch(
             "microsoft_jobs_scraper.scraper.fetch_job_details",
-            AsyncMock(return_value=sample_api_details),
+            new=_returning(sample_api_details),
         ):
-            await scraper.scrape_job_details_batch(sample_job_cards)
+            await mocked_scraper.scrape_job_details_batch(sample_job_cards)
 
         mock_page.close.assert_called_once()
 
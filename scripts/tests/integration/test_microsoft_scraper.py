@@ -5,6 +5,7 @@ Tests the data transformation, deduplication logic, and filter methods.
 """
 
 import pytest
+from unittest.mock import patch
 
 from scripts.microsoft_jobs_scraper.scraper import MicrosoftJobsScraper
 from shared.models import JobListing
@@ -148,6 +149,23 @@ class TestDeduplicateJobs:
         assert len(result) == 1
         assert result[0].title == "First Version"
 
+    def test_deduplicate_jobs_transforms_each_unique_id_once(self, microsoft_scraper):
+        """Duplicates are dropped before transform, not after"""
+        jobs = [
+            {"id": job_id, "title": "Software Engineer",
+             "job_url": f"https://apply.careers.microsoft.com/careers?position_id={job_id}"}
+            for job_id in ("111", "222", "111", "333", "222")
+        ]
+
+        with patch.object(
+            microsoft_scraper, "transform_to_job_model",
+            wraps=microsoft_scraper.transform_to_job_model,
+        ) as transform:
+            result = microsoft_scraper.deduplicate_jobs(jobs)
+
+        assert [j.id for j in result] == ["111", "222", "333"]
+        assert transform.call_count == 3
+
     def test_deduplicate_jobs_empty_list(self, microsoft_scraper):
         """Handles empty list"""
         result = microsoft_scraper.deduplicate_jobs([])
@@ -242,6 +260,14 @@ class TestFilterJob:
         assert microsoft_scraper.filter_job("Sales Representative") is False
         assert microsoft_scraper.filter_job("Retail Store Manager") is False
 
+    def test_filter_job_keeps_case_insensitive_substring_matching(self, microsoft_scraper):
+        """Keywords match anywhere in the title, in any case"""
+        assert microsoft_scraper.filter_job("Principal ENGINEERING Manager") is True
+        assert microsoft_scraper.filter_job("Site Reliability (sre) Lead") is True
+        # Exclusion wins over inclusion
+        assert microsoft_scraper.filter_job("Sales Engineer") is False
+        assert microsoft_scraper.filter_job("Office Coordinator") is False
+
 
 class TestGetCompanyName:
     """Tests for get_company_name method"""
@@ -5,17 +5,32 @@ Tests scrape_query() and related async functionality with mocked Playwright.
 """
 
 import pytest
-import sys
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from unittest.mock import AsyncMock, patch
 
 from microsoft_jobs_scraper.scraper import MicrosoftJobsScraper
 from microsoft_jobs_scraper.parser import JobCardExtractionError
 from microsoft_jobs_scraper.api_client import JobSearchError
 
 
+def _page_results(*results):
+    """Plain coroutine stand-in for _fetch_page_jobs that returns (or raises) results in order.
+
+    Counts calls in .call_count so pagination tests can still assert on it
+    without AsyncMock's per-call recording.
+    """
+    remaining = iter(results)
+
+    async def _fetch(*args, **kwargs):
+        _fetch.call_count += 1
+        result = next(remaining)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    _fetch.call_count = 0
+    return _fetch
+
+
 @pytest.fixture
 def mock_page():
     """Create a mock Playwright page object"""
@@ -33,9 +48,24 @@ def mock_context(mock_page):
 
 
 @pytest.fixture
+def mocked_scraper(mock_context):
+    """Search scraper wired to mock_context, with navigation, session and delay mocked"""
+    scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
+    scraper.context = mock_context
+    scraper.navigate_to_page = AsyncMock()
+    scraper._establish_session = AsyncMock()
+    scraper._random_delay = AsyncMock()
+    return scraper
+
+
+@pytest.fixture(scope="module")
 def sample_job_cards():
-    """Sample job cards as returned from API or HTML parsing"""
-    return [
+    """Sample job cards as returned from API or HTML parsing.
+
+    Shared by every test in the module as a tuple: scrape_query only filters
+    and collects the cards, so tests must treat them as read-only.
+    """
+    return (
         {
             "id": "1970393556642428",
             "title": "Software Engineer II",
@@ -54,26 +84,21 @@ def sample_job_cards():
             "job_number": "200016307",
             "company": "microsoft",
         },
-    ]
+    )
 
 
 class TestScrapeQuerySinglePage:
     """Tests for scrape_query with single page of results"""
 
     @pytest.mark.asyncio
-    async def test_scrape_query_single_page_api_success(self, mock_context, mock_page, sample_job_cards):
+    async def test_scrape_query_single_page_api_success(self, mocked_scraper, mock_page, sample_job_cards):
         """API returns jobs, no more pages"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch.object(
-            scraper,
+            mocked_scraper,
             "_fetch_page_jobs",
             AsyncMock(return_value=(sample_job_cards, False, "API")),
         ):
-            result = await scraper.scrape_query("software engineer", max_jobs=None)
+            result = await mocked_scraper.scrape_query("software engineer", max_jobs=None)
 
         assert len(result) == 2
         assert result[0]["id"] == "1970393556642428"
@@ -81,13 +106,8 @@ class TestScrapeQuerySinglePage:
         mock_page.close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_scrape_query_filters_non_software_jobs(self, mock_context, mock_page):
+    async def test_scrape_query_filters_non_software_jobs(self, mocked_scraper, mock_page):
         """Jobs filtered by title keywords"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         mixed_jobs = [
             {
                 "id": "1234567890",
@@ -110,11 +130,11 @@ class TestScrapeQuerySinglePage:
         ]
 
         with patch.object(
-            scraper,
+            mocked_scraper,
             "_fetch_page_jobs",
             AsyncMock(return_value=(mixed_jobs, False, "API")),
         ):
-            result = await scraper.scrape_query("", max_jobs=None)
+            result = await mocked_scraper.scrape_query("", max_jobs=None)
 
         assert len(result) == 2
         titles = [j["title"] for j in result]
@@ -127,15 +147,8 @@ class TestScrapeQueryPagination:
     """Tests for scrape_query pagination handling"""
 
     @pytest.mark.asyncio
-    async def test_scrape_query_multiple_pages(self, mock_context, mock_page, sample_job_cards):
+    async def test_scrape_query_multiple_pages(self, mocked_scraper, mock_page, sample_job_cards):
         """has_more triggers pagination"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-        scraper._random_delay = AsyncMock()
-
-        page_1_cards = sample_job_cards.copy()
         page_2_cards = [
             {
                 "id": "2222222222",
@@ -146,45 +159,32 @@ class TestScrapeQueryPagination:
             }
         ]
 
-        fetch_mock = AsyncMock(side_effect=[
-            (page_1_cards, True, "API"),
+        fetch_mock = _page_results(
+            (sample_job_cards, True, "API"),
             (page_2_cards, False, "API"),
-        ])
+        )
 
-        with patch.object(scraper, "_fetch_page_jobs", fetch_mock):
-            result = await scraper.scrape_query("", max_jobs=None)
+        with patch.object(mocked_scraper, "_fetch_page_jobs", fetch_mock):
+            result = await mocked_scraper.scrape_query("", max_jobs=None)
 
         assert len(result) == 3
         assert fetch_mock.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_scrape_query_stops_when_no_more(self, mock_context, mock_page, sample_job_cards):
+    async def test_scrape_query_stops_when_no_more(self, mocked_scraper, mock_page, sample_job_cards):
         """Stops when has_more=False"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-        scraper._random_delay = AsyncMock()
-
         fetch_mock = AsyncMock(return_value=(sample_job_cards, False, "API"))
 
-        with patch.object(scraper, "_fetch_page_jobs", fetch_mock):
-            result = await scraper.scrape_query("", max_jobs=None)
+        with patch.object(mocked_scraper, "_fetch_page_jobs", fetch_mock):
+            result = await mocked_scraper.scrape_query("", max_jobs=None)
 
         assert len(result) == 2
         assert fetch_mock.call_count == 1
-        scraper._random_delay.assert_not_called()
+        mocked_scraper._random_delay.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_scrape_query_calls_random_delay(self, mock_context, mock_page, sample_job_cards):
+    async def test_scrape_query_calls_random_delay(self, mocked_scraper, mock_page, sample_job_cards):
         """Delay called between pages"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-        scraper._random_delay = AsyncMock()
-
-        page_1_cards = sample_job_cards.copy()
         page_2_cards = [
             {
                 "id": "3333333333",
@@ -194,56 +194,45 @@ class TestScrapeQueryPagination:
             }
         ]
 
-        fetch_mock = AsyncMock(side_effect=[
-            (page_1_cards, True, "API"),
+        fetch_mock = _page_results(
+            (sample_job_cards, True, "API"),
             (page_2_cards, False, "API"),
-        ])
+        )
 
-        with patch.object(scraper, "_fetch_page_jobs", fetch_mock):
-            await scraper.scrape_query("", max_jobs=None)
+        with patch.object(mocked_scraper, "_fetch_page_jobs", fetch_mock):
+            await mocked_scraper.scrape_query("", max_jobs=None)
 
         # Delay called once between page 1 and page 2
-        assert scraper._random_delay.call_count == 1
+        assert mocked_scraper._random_delay.call_count == 1
 
 
 class TestScrapeQueryMaxJobsLimit:
     """Tests for max_jobs limit"""
 
     @pytest.mark.asyncio
-    async def test_scrape_query_max_jobs_truncates(self, mock_context, mock_page, sample_job_cards):
+    async def test_scrape_query_max_jobs_truncates(self, mocked_scraper, mock_page, sample_job_cards):
         """Returns max_jobs limit"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         # Return many jobs on first page
         many_job_cards = sample_job_cards * 5  # 10 jobs total
 
         with patch.object(
-            scraper,
+            mocked_scraper,
             "_fetch_page_jobs",
             AsyncMock(return_value=(many_job_cards, True, "API")),
         ):
-            result = await scraper.scrape_query("", max_jobs=3)
+            result = await mocked_scraper.scrape_query("", max_jobs=3)
 
         assert len(result) == 3
 
     @pytest.mark.asyncio
-    async def test_scrape_query_max_jobs_stops_early(self, mock_context, mock_page, sample_job_cards):
+    async def test_scrape_query_max_jobs_stops_early(self, mocked_scraper, mock_page, sample_job_cards):
         """Stops pagination early when max_jobs reached"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-        scraper._random_delay = AsyncMock()
-
         many_job_cards = sample_job_cards * 3  # 6 jobs
 
         fetch_mock = AsyncMock(return_value=(many_job_cards, True, "API"))
 
-        with patch.object(scraper, "_fetch_page_jobs", fetch_mock):
-            result = await scraper.scrape_query("", max_jobs=5)
+        with patch.object(mocked_scraper, "_fetch_page_jobs", fetch_mock):
+            result = await mocked_scraper.scrape_query("", max_jobs=5)
 
         assert len(result) == 5
         # Should stop after first page since we got enough jobs
@@ -255,81 +244,58 @@ class TestScrapeQueryErrorRecovery:
 
     @pytest.mark.asyncio
     async def test_scrape_query_recovers_from_single_error(
-        self, mock_context, mock_page, sample_job_cards
+        self, mocked_scraper, mock_page, sample_job_cards
     ):
         """Recovers after one error"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-        scraper._random_delay = AsyncMock()
-
         # First call fails, second succeeds
-        fetch_mock = AsyncMock(side_effect=[
+        fetch_mock = _page_results(
             Exception("Network timeout"),
             (sample_job_cards, False, "API"),
-        ])
+        )
 
-        with patch.object(scraper, "_fetch_page_jobs", fetch_mock):
-            result = await scraper.scrape_query("", max_jobs=None)
+        with patch.object(mocked_scraper, "_fetch_page_jobs", fetch_mock):
+            result = await mocked_scraper.scrape_query("", max_jobs=None)
 
         # Should have recovered and collected jobs
         assert len(result) == 2
 
     @pytest.mark.asyncio
-    async def test_scrape_query_consecutive_errors_stops(self, mock_context, mock_page):
+    async def test_scrape_query_consecutive_errors_stops(self, mocked_scraper, mock_page):
         """Stops after 3 consecutive errors"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-        scraper._random_delay = AsyncMock()
-
         # All calls fail
         fetch_mock = AsyncMock(side_effect=Exception("Network error"))
 
-        with patch.object(scraper, "_fetch_page_jobs", fetch_mock):
-            result = await scraper.scrape_query("", max_jobs=None)
+        with patch.object(mocked_scraper, "_fetch_page_jobs", fetch_mock):
+            result = await mocked_scraper.scrape_query("", max_jobs=None)
 
         # Should stop after 3 consecutive errors and return empty list
         assert result == []
         assert fetch_mock.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_scrape_query_empty_page_stops(self, mock_context, mock_page):
+    async def test_scrape_query_empty_page_stops(self, mocked_scraper, mock_page):
         """Empty results stops pagination"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-
         with patch.object(
-            scraper,
+            mocked_scraper,
             "_fetch_page_jobs",
             AsyncMock(return_value=([], False, "API")),
         ):
-            result = await scraper.scrape_query("", max_jobs=None)
+            result = await mocked_scraper.scrape_query("", max_jobs=None)
 
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_scrape_query_extraction_error_continues(self, mock_context, mock_page, sample_job_cards):
+    async def test_scrape_query_extraction_error_continues(self, mocked_scraper, mock_page, sample_job_cards):
         """Continues collecting jobs from successful pages even with extraction errors"""
-        scraper = MicrosoftJobsScraper(headless=True, detail_scrape=False)
-        scraper.context = mock_context
-        scraper.navigate_to_page = AsyncMock()
-        scraper._establish_session = AsyncMock()
-        scraper._random_delay = AsyncMock()
-
         # First page succeeds, second fails with extraction error, third succeeds
-        fetch_mock = AsyncMock(side_effect=[
+        fetch_mock = _page_results(
             (sample_job_cards, True, "API"),
             Exception("Extraction error"),
             ([{"id": "9999", "title": "Cloud Engineer", "job_url": "url", "company": "microsoft"}], False, "API"),
-        ])
+        )
 
-        with patch.object(scraper, "_fetch_page_jobs", fetch_mock):
-            result = await scraper.scrape_query("", max_jobs=None)
+        with patch.object(mocked_scraper, "_fetch_page_jobs", fetch_mock):
+            result = await mocked_scraper.scrape_query("", max_jobs=None)
 
         # Should have collected jobs from page 1 and page 3
         assert len(result) == 3
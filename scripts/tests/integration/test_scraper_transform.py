@@ -5,10 +5,7 @@ Tests the data transformation and deduplication logic.
 """
 
 import pytest
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from unittest.mock import patch
 
 from google_jobs_scraper.scraper import GoogleJobsScraper
 from google_jobs_scraper.models import GoogleJob
@@ -137,6 +134,23 @@ class TestDeduplicateJobs:
         assert len(result) == 1
         assert result[0].title == "First Version"
 
+    def test_deduplicate_jobs_transforms_each_unique_url_once(self, scraper):
+        """Duplicates are dropped before transform, not after"""
+        base = "https://www.google.com/about/careers/applications/jobs/results"
+        jobs = [
+            {"title": "Software Engineer", "job_url": f"{base}/{job_id}-software-engineer"}
+            for job_id in ("111", "222", "111", "333", "222")
+        ]
+
+        with patch.object(
+            scraper, "transform_to_job_model",
+            wraps=scraper.transform_to_job_model,
+        ) as transform:
+            result = scraper.deduplicate_jobs(jobs)
+
+        assert [j.id for j in result] == ["111", "222", "333"]
+        assert transform.call_count == 3
+
     def test_deduplicate_jobs_empty_list(self, scraper):
         """Handles empty list"""
         result = scraper.deduplicate_jobs([])
@@ -4,12 +4,8 @@ Unit tests for Apple Jobs API client functions (apple_jobs_scraper/api_client.py
 
 import asyncio
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from apple_jobs_scraper import api_client as apple_api_client
 from apple_jobs_scraper.api_client import (
     parse_qualifications,
@@ -3,10 +3,6 @@ Unit tests for Apple Jobs parser functions (apple_jobs_scraper/parser.py)
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from apple_jobs_scraper.parser import extract_job_id_from_url
 
@@ -5,12 +5,8 @@ Tests extract_job_cards_from_list() and check_has_next_page() with mocked page o
 """
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from apple_jobs_scraper.parser import (
     extract_job_cards_from_list,
     check_has_next_page,
@@ -20,7 +16,11 @@ from apple_jobs_scraper.parser import (
 
 @pytest.fixture
 def mock_page():
-    """Create a mock Playwright page object"""
+    """Create a mock Playwright page object.
+
+    Its methods are already AsyncMock children: tests configure them via
+    .return_value / .side_effect rather than assigning new AsyncMocks.
+    """
     page = AsyncMock()
     return page
 
@@ -38,35 +38,26 @@ class TestExtractJobCardsFromListSuccess:
     @pytest.mark.asyncio
     async def test_extract_job_cards_from_list_success(self, mock_page):
         """Extracts jobs from mocked page"""
-        # Mock the job list selector
-        mock_page.wait_for_selector = AsyncMock()
-
         # Create mock job elements
         mock_element_1 = AsyncMock()
-        mock_element_1.evaluate = AsyncMock(
-            return_value={
-                "title": "Software Engineer",
-                "href": "/en-us/details/200640732-0836/software-engineer?team=SFTWR",
-                "team": "Engineering",
-                "location": "Cupertino, California",
-                "postedDate": "Jan 10, 2025",
-            }
-        )
+        mock_element_1.evaluate.return_value = {
+            "title": "Software Engineer",
+            "href": "/en-us/details/200640732-0836/software-engineer?team=SFTWR",
+            "team": "Engineering",
+            "location": "Cupertino, California",
+            "postedDate": "Jan 10, 2025",
+        }
 
         mock_element_2 = AsyncMock()
-        mock_element_2.evaluate = AsyncMock(
-            return_value={
-                "title": "Data Scientist",
-                "href": "/en-us/details/200640733-0836/data-scientist?team=MLAI",
-                "team": "Machine Learning",
-                "location": "Austin, Texas",
-                "postedDate": "Jan 8, 2025",
-            }
-        )
-
-        mock_page.query_selector_all = AsyncMock(
-            return_value=[mock_element_1, mock_element_2]
-        )
+        mock_element_2.evaluate.return_value = {
+            "title": "Data Scientist",
+            "href": "/en-us/details/200640733-0836/data-scientist?team=MLAI",
+            "team": "Machine Learning",
+            "location": "Austin, Texas",
+            "postedDate": "Jan 8, 2025",
+        }
+
+        mock_page.query_selector_all.return_value = [mock_element_1, mock_element_2]
 
         result = await extract_job_cards_from_list(mock_page)
 
@@ -80,20 +71,16 @@ class TestExtractJobCardsFromListSuccess:
     @pytest.mark.asyncio
     async def test_extract_job_cards_from_list_with_complete_data(self, mock_page):
         """Extracts all fields correctly"""
-        mock_page.wait_for_selector = AsyncMock()
-
         mock_element = AsyncMock()
-        mock_element.evaluate = AsyncMock(
-            return_value={
-                "title": "Senior Software Engineer",
-                "href": "/en-us/details/123456789-0836/senior-software-engineer?team=CLOUD",
-                "team": "Cloud Platform",
-                "location": "San Francisco, California, United States",
-                "postedDate": "Dec 15, 2024",
-            }
-        )
-
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_element])
+        mock_element.evaluate.return_value = {
+            "title": "Senior Software Engineer",
+            "href": "/en-us/details/123456789-0836/senior-software-engineer?team=CLOUD",
+            "team": "Cloud Platform",
+            "location": "San Francisco, California, United States",
+            "postedDate": "Dec 15, 2024",
+        }
+
+        mock_page.query_selector_all.return_value = [mock_element]
 
         result = await extract_job_cards_from_list(mock_page)
 
@@ -113,8 +100,7 @@ class TestExtractJobCardsFromListEmpty:
     @pytest.mark.asyncio
     async def test_extract_job_cards_from_list_empty(self, mock_page):
         """Returns empty list when no jobs"""
-        mock_page.wait_for_selector = AsyncMock()
-        mock_page.query_selector_all = AsyncMock(return_value=[])
+        mock_page.query_selector_all.return_value = []
 
         result = await extract_job_cards_from_list(mock_page)
 
@@ -123,12 +109,10 @@ class TestExtractJobCardsFromListEmpty:
     @pytest.mark.asyncio
     async def test_extract_job_cards_from_list_null_elements(self, mock_page):
         """Handles elements that return None from evaluate"""
-        mock_page.wait_for_selector = AsyncMock()
-
         mock_element = AsyncMock()
-        mock_element.evaluate = AsyncMock(return_value=None)
+        mock_element.evaluate.return_value = None
 
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_element])
+        mock_page.query_selector_all.return_value = [mock_element]
 
         result = await extract_job_cards_from_list(mock_page)
 
@@ -141,9 +125,7 @@ class TestExtractJobCardsFromListError:
     @pytest.mark.asyncio
     async def test_extract_job_cards_from_list_selector_timeout(self, mock_page):
         """Raises JobCardExtractionError on selector timeout"""
-        mock_page.wait_for_selector = AsyncMock(
-            side_effect=Exception("Timeout waiting for selector")
-        )
+        mock_page.wait_for_selector.side_effect = Exception("Timeout waiting for selector")
 
         with pytest.raises(JobCardExtractionError) as exc_info:
             await extract_job_cards_from_list(mock_page)
@@ -153,19 +135,15 @@ class TestExtractJobCardsFromListError:
     @pytest.mark.asyncio
     async def test_extract_job_cards_from_list_all_parse_failures(self, mock_page):
         """Returns empty list when all elements fail to parse (caught internally)"""
-        mock_page.wait_for_selector = AsyncMock()
-
         # Elements that raise exceptions during parsing - caught by _parse_job_element
         # which returns None, so empty list is returned (not an error)
         mock_element_1 = AsyncMock()
-        mock_element_1.evaluate = AsyncMock(side_effect=Exception("Parse error"))
+        mock_element_1.evaluate.side_effect = Exception("Parse error")
 
         mock_element_2 = AsyncMock()
-        mock_element_2.evaluate = AsyncMock(side_effect=Exception("Parse error"))
+        mock_element_2.evaluate.side_effect = Exception("Parse error")
 
-        mock_page.query_selector_all = AsyncMock(
-            return_value=[mock_element_1, mock_element_2]
-        )
+        mock_page.query_selector_all.return_value = [mock_element_1, mock_element_2]
 
         # _parse_job_element catches exceptions and returns None, so result is empty list
         result = await extract_job_cards_from_list(mock_page)
@@ -175,26 +153,20 @@ class TestExtractJobCardsFromListError:
     @pytest.mark.asyncio
     async def test_extract_job_cards_from_list_partial_failures(self, mock_page):
         """Continues on partial parse failures"""
-        mock_page.wait_for_selector = AsyncMock()
-
         # First element fails, second succeeds
         mock_element_1 = AsyncMock()
-        mock_element_1.evaluate = AsyncMock(side_effect=Exception("Parse error"))
+        mock_element_1.evaluate.side_effect = Exception("Parse error")
 
         mock_element_2 = AsyncMock()
-        mock_element_2.evaluate = AsyncMock(
-            return_value={
-                "title": "Software Engineer",
-                "href": "/en-us/details/123456/software-engineer",
-                "team": "Engineering",
-                "location": "Cupertino",
-                "postedDate": "Jan 1, 2025",
-            }
-        )
-
-        mock_page.query_selector_all = AsyncMock(
-            return_value=[mock_element_1, mock_element_2]
-        )
+        mock_element_2.evaluate.return_value = {
+            "title": "Software Engineer",
+            "href": "/en-us/details/123456/software-engineer",
+            "team": "Engineering",
+            "location": "Cupertino",
+            "postedDate": "Jan 1, 2025",
+        }
+
+        mock_page.query_selector_all.return_value = [mock_element_1, mock_element_2]
 
         result = await extract_job_cards_from_list(mock_page)
 
@@ -210,19 +182,8 @@ class TestCheckHasNextPageTrue:
     async def test_check_has_next_page_true(self, mock_page):
         """Returns True when next button exists and is enabled"""
         mock_button = AsyncMock()
-        mock_button.get_attribute = AsyncMock(return_value=None)  # Not disabled
-        mock_page.query_selector = AsyncMock(return_value=mock_button)
-
-        result = await check_has_next_page(mock_page)
-
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_check_has_next_page_button_exists_no_disabled(self, mock_page):
-        """Returns True when button exists without disabled attribute"""
-        mock_button = AsyncMock()
-        mock_button.get_attribute = AsyncMock(return_value=None)
-        mock_page.query_selector = AsyncMock(return_value=mock_button)
+        mock_button.get_attribute.return_value = None  # Not disabled
+        mock_page.query_selector.return_value = mock_button
 
         result = await check_has_next_page(mock_page)
 
@@ -235,29 +196,19 @@ class TestCheckHasNextPageFalse:
     @pytest.mark.asyncio
     async def test_check_has_next_page_false_no_button(self, mock_page):
         """Returns False when no next button exists"""
-        mock_page.query_selector = AsyncMock(return_value=None)
+        mock_page.query_selector.return_value = None
 
         result = await check_has_next_page(mock_page)
 
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_check_has_next_page_false_disabled(self, mock_page):
-        """Returns False when button is disabled"""
+    @pytest.mark.parametrize("disabled_attr", ["true", ""], ids=["disabled_true", "disabled_empty_string"])
+    async def test_check_has_next_page_false_disabled(self, mock_page, disabled_attr):
+        """Returns False when button carries a disabled attribute, whatever its value"""
         mock_button = AsyncMock()
-        mock_button.get_attribute = AsyncMock(return_value="true")  # Disabled
-        mock_page.query_selector = AsyncMock(return_value=mock_button)
-
-        result = await check_has_next_page(mock_page)
-
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_check_has_next_page_false_disabled_empty_string(self, mock_page):
-        """Returns False when button has disabled=""  """
-        mock_button = AsyncMock()
-        mock_button.get_attribute = AsyncMock(return_value="")  # Disabled with empty value
-        mock_page.query_selector = AsyncMock(return_value=mock_button)
+        mock_button.get_attribute.return_value = disabled_attr
+        mock_page.query_selector.return_value = mock_button
 
         result = await check_has_next_page(mock_page)
 
@@ -266,7 +217,7 @@ class TestCheckHasNextPageFalse:
     @pytest.mark.asyncio
     async def test_check_has_next_page_handles_exception(self, mock_page):
         """Returns None on exception to signal check failure"""
-        mock_page.query_selector = AsyncMock(side_effect=Exception("Page error"))
+        mock_page.query_selector.side_effect = Exception("Page error")
 
         result = await check_has_next_page(mock_page)
 
@@ -279,20 +230,16 @@ class TestExtractJobCardsEdgeCases:
     @pytest.mark.asyncio
     async def test_extract_job_cards_missing_href(self, mock_page):
         """Skips elements without href"""
-        mock_page.wait_for_selector = AsyncMock()
-
         mock_element = AsyncMock()
-        mock_element.evaluate = AsyncMock(
-            return_value={
-                "title": "Software Engineer",
-                "href": None,  # Missing href
-                "team": "Engineering",
-                "location": "Cupertino",
-                "postedDate": "Jan 1, 2025",
-            }
-        )
-
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_element])
+        mock_element.evaluate.return_value = {
+            "title": "Software Engineer",
+            "href": None,  # Missing href
+            "team": "Engineering",
+            "location": "Cupertino",
+            "postedDate": "Jan 1, 2025",
+        }
+
+        mock_page.query_selector_all.return_value = [mock_element]
 
         result = await extract_job_cards_from_list(mock_page)
 
@@ -302,20 +249,16 @@ class TestExtractJobCardsEdgeCases:
     @pytest.mark.asyncio
     async def test_extract_job_cards_invalid_href_format(self, mock_page):
         """Skips elements with invalid href (no /details/)"""
-        mock_page.wait_for_selector = AsyncMock()
-
         mock_element = AsyncMock()
-        mock_element.evaluate = AsyncMock(
-            return_value={
-                "title": "Software Engineer",
-                "href": "/en-us/search?location=usa",  # No /details/ in href
-                "team": "Engineering",
-                "location": "Cupertino",
-                "postedDate": "Jan 1, 2025",
-            }
-        )
-
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_element])
+        mock_element.evaluate.return_value = {
+            "title": "Software Engineer",
+            "href": "/en-us/search?location=usa",  # No /details/ in href
+            "team": "Engineering",
+            "location": "Cupertino",
+            "postedDate": "Jan 1, 2025",
+        }
+
+        mock_page.query_selector_all.return_value = [mock_element]
 
         result = await extract_job_cards_from_list(mock_page)
 
@@ -7,14 +7,10 @@ the appleScraperHangFix work (see docs/implementations/appleScraperHangFix/PLAN.
 """
 
 import asyncio
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from apple_jobs_scraper.scraper import AppleJobsScraper, _APPLE_GOTO_WAIT_UNTIL
 
 
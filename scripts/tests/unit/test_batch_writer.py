@@ -3,14 +3,30 @@ Unit tests for BatchWriter (shared/batch_writer.py)
 """
 
 import pytest
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock, patch
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from unittest.mock import MagicMock
 
+from shared import batch_writer
 from shared.batch_writer import BatchWriter, BatchWriterStats
-from shared.models import JobListing
+
+
+@pytest.fixture
+def mock_conn():
+    """Opaque connection handle; BatchWriter only passes it to the (patched) db module"""
+    return object()
+
+
+@pytest.fixture
+def mock_db(monkeypatch):
+    """Replace the db module BatchWriter writes through"""
+    db = MagicMock()
+    monkeypatch.setattr(batch_writer, "db", db)
+    return db
+
+
+@pytest.fixture
+def mock_scraper():
+    """Scraper stand-in limited to the one method BatchWriter calls"""
+    return MagicMock(spec=["transform_to_job_model"])
 
 
 class TestBatchWriterStats:
@@ -28,11 +44,8 @@ class TestBatchWriterStats:
 class TestBatchWriterInit:
     """Tests for BatchWriter initialization"""
 
-    def test_init_with_defaults(self):
+    def test_init_with_defaults(self, mock_conn, mock_scraper):
         """Initializes with default batch_size and flags"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-
         writer = BatchWriter(mock_conn, mock_scraper)
 
         assert writer.db_conn == mock_conn
@@ -42,11 +55,8 @@ class TestBatchWriterInit:
         assert writer.use_upsert is True
         assert writer.get_buffer_size() == 0
 
-    def test_init_with_custom_params(self):
+    def test_init_with_custom_params(self, mock_conn, mock_scraper):
         """Accepts custom batch_size and flags"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-
         writer = BatchWriter(
             mock_conn, mock_scraper,
             batch_size=100,
@@ -58,21 +68,15 @@ class TestBatchWriterInit:
         assert writer.detail_scrape is False
         assert writer.use_upsert is False
 
-    def test_init_rejects_zero_batch_size(self):
+    def test_init_rejects_zero_batch_size(self, mock_conn, mock_scraper):
         """Raises ValueError for batch_size=0"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-
         with pytest.raises(ValueError) as exc_info:
             BatchWriter(mock_conn, mock_scraper, batch_size=0)
 
         assert "batch_size must be positive" in str(exc_info.value)
 
-    def test_init_rejects_negative_batch_size(self):
+    def test_init_rejects_negative_batch_size(self, mock_conn, mock_scraper):
         """Raises ValueError for negative batch_size"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-
         with pytest.raises(ValueError) as exc_info:
             BatchWriter(mock_conn, mock_scraper, batch_size=-5)
 
@@ -82,27 +86,9 @@ class TestBatchWriterInit:
 class TestBatchWriterAdd:
     """Tests for BatchWriter.add_job method"""
 
-    def test_add_job_increments_buffer(self):
+    def test_add_job_increments_buffer(self, make_job_listing, mock_conn, mock_scraper):
         """Adding a job increases buffer size"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-        mock_scraper.transform_to_job_model.return_value = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="test",
-            location="Test Location",
-            url="https://test.com/job",
-            source_id="test_scraper",
-            details={},
-            created_at="2024-01-15T10:30:00Z",
-            status="OPEN",
-            has_matched=False,
-            ai_metadata={},
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z",
-            consecutive_misses=0,
-            details_scraped=False
-        )
+        mock_scraper.transform_to_job_model.return_value = make_job_listing("job-001")
 
         writer = BatchWriter(mock_conn, mock_scraper, batch_size=10)
         writer.add_job({"id": "job-001", "title": "Test Job"}, "2024-01-15T10:30:00Z")
@@ -110,27 +96,9 @@ class TestBatchWriterAdd:
         assert writer.get_buffer_size() == 1
         assert writer.stats.total_processed == 1
 
-    def test_add_job_sets_timestamps(self):
+    def test_add_job_sets_timestamps(self, make_job_listing, mock_conn, mock_scraper):
         """add_job sets first_seen_at and last_seen_at from timestamp"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-        job = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="test",
-            location="Test Location",
-            url="https://test.com/job",
-            source_id="test_scraper",
-            details={},
-            created_at="2024-01-15T10:30:00Z",
-            status="OPEN",
-            has_matched=False,
-            ai_metadata={},
-            first_seen_at="",  # Will be overwritten
-            last_seen_at="",   # Will be overwritten
-            consecutive_misses=0,
-            details_scraped=False
-        )
+        job = make_job_listing("job-001", first_seen_at="", last_seen_at="")
         mock_scraper.transform_to_job_model.return_value = job
 
         writer = BatchWriter(mock_conn, mock_scraper, batch_size=10)
@@ -140,27 +108,9 @@ class TestBatchWriterAdd:
         assert writer._buffer[0].first_seen_at == "2024-01-20T12:00:00Z"
         assert writer._buffer[0].last_seen_at == "2024-01-20T12:00:00Z"
 
-    def test_add_job_sets_details_scraped_flag(self):
+    def test_add_job_sets_details_scraped_flag(self, make_job_listing, mock_conn, mock_scraper):
         """add_job sets details_scraped based on constructor flag"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-        job = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="test",
-            location="Test Location",
-            url="https://test.com/job",
-            source_id="test_scraper",
-            details={},
-            created_at="2024-01-15T10:30:00Z",
-            status="OPEN",
-            has_matched=False,
-            ai_metadata={},
-            first_seen_at="",
-            last_seen_at="",
-            consecutive_misses=0,
-            details_scraped=False
-        )
+        job = make_job_listing("job-001", first_seen_at="", last_seen_at="")
         mock_scraper.transform_to_job_model.return_value = job
 
         # With detail_scrape=True (default)
@@ -168,10 +118,8 @@ class TestBatchWriterAdd:
         writer.add_job({"id": "job-001"}, "2024-01-20T12:00:00Z")
         assert writer._buffer[0].details_scraped is True
 
-    def test_add_job_handles_transform_error(self):
+    def test_add_job_handles_transform_error(self, mock_conn, mock_scraper):
         """Errors in transform_to_job_model are caught and counted"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
         mock_scraper.transform_to_job_model.side_effect = ValueError("Transform failed")
 
         writer = BatchWriter(mock_conn, mock_scraper, batch_size=10)
@@ -185,39 +133,18 @@ class TestBatchWriterAdd:
 class TestBatchWriterFlush:
     """Tests for BatchWriter.flush method"""
 
-    def test_flush_empty_buffer_returns_zero(self):
+    def test_flush_empty_buffer_returns_zero(self, mock_db, mock_conn, mock_scraper):
         """Flushing empty buffer returns 0 and doesn't call db"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-
         writer = BatchWriter(mock_conn, mock_scraper)
         result = writer.flush()
 
         assert result == 0
         assert writer.stats.batches_written == 0
+        mock_db.upsert_jobs_batch.assert_not_called()
 
-    @patch('shared.batch_writer.db')
-    def test_flush_calls_upsert_when_use_upsert_true(self, mock_db):
+    def test_flush_calls_upsert_when_use_upsert_true(self, make_job_listing, mock_db, mock_conn, mock_scraper):
         """Uses upsert_jobs_batch when use_upsert=True"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-        job = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="test",
-            location="Test",
-            url="https://test.com",
-            source_id="test",
-            details={},
-            created_at="2024-01-15T10:30:00Z",
-            status="OPEN",
-            has_matched=False,
-            ai_metadata={},
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z",
-            consecutive_misses=0,
-            details_scraped=False
-        )
+        job = make_job_listing("job-001")
         mock_scraper.transform_to_job_model.return_value = job
         mock_db.upsert_jobs_batch.return_value = 1
 
@@ -230,28 +157,9 @@ class TestBatchWriterFlush:
         assert writer.stats.total_written == 1
         assert writer.stats.batches_written == 1
 
-    @patch('shared.batch_writer.db')
-    def test_flush_calls_insert_when_use_upsert_false(self, mock_db):
+    def test_flush_calls_insert_when_use_upsert_false(self, make_job_listing, mock_db, mock_conn, mock_scraper):
         """Uses insert_jobs_batch when use_upsert=False"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-        job = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="test",
-            location="Test",
-            url="https://test.com",
-            source_id="test",
-            details={},
-            created_at="2024-01-15T10:30:00Z",
-            status="OPEN",
-            has_matched=False,
-            ai_metadata={},
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z",
-            consecutive_misses=0,
-            details_scraped=False
-        )
+        job = make_job_listing("job-001")
         mock_scraper.transform_to_job_model.return_value = job
         mock_db.insert_jobs_batch.return_value = 1
 
@@ -262,28 +170,9 @@ class TestBatchWriterFlush:
         mock_db.insert_jobs_batch.assert_called_once()
         assert result == 1
 
-    @patch('shared.batch_writer.db')
-    def test_flush_clears_buffer(self, mock_db):
+    def test_flush_clears_buffer(self, make_job_listing, mock_db, mock_conn, mock_scraper):
         """Flush empties the buffer after writing"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-        job = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="test",
-            location="Test",
-            url="https://test.com",
-            source_id="test",
-            details={},
-            created_at="2024-01-15T10:30:00Z",
-            status="OPEN",
-            has_matched=False,
-            ai_metadata={},
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z",
-            consecutive_misses=0,
-            details_scraped=False
-        )
+        job = make_job_listing("job-001")
         mock_scraper.transform_to_job_model.return_value = job
         mock_db.upsert_jobs_batch.return_value = 1
 
@@ -298,73 +187,40 @@ class TestBatchWriterFlush:
 class TestBatchWriterAutoFlush:
     """Tests for automatic flush when batch_size is reached"""
 
-    @patch('shared.batch_writer.db')
-    def test_auto_flush_at_batch_size(self, mock_db):
-        """Buffer automatically flushes when batch_size is reached"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-
-        def create_job(job_data):
-            return JobListing(
-                id=job_data.get("id", "unknown"),
-                title="Test Job",
-                company="test",
-                location="Test",
-                url="https://test.com",
-                source_id="test",
-                details={},
-                created_at="2024-01-15T10:30:00Z",
-                status="OPEN",
-                has_matched=False,
-                ai_metadata={},
-                first_seen_at="2024-01-15T10:30:00Z",
-                last_seen_at="2024-01-15T10:30:00Z",
-                consecutive_misses=0,
-                details_scraped=False
-            )
-
-        mock_scraper.transform_to_job_model.side_effect = create_job
-        mock_db.upsert_jobs_batch.return_value = 3
-
-        writer = BatchWriter(mock_conn, mock_scraper, batch_size=3)
-
-        # Add 3 jobs - should trigger auto-flush
-        writer.add_job({"id": "job-001"}, "2024-01-15T10:30:00Z")
-        writer.add_job({"id": "job-002"}, "2024-01-15T10:30:00Z")
-        writer.add_job({"id": "job-003"}, "2024-01-15T10:30:00Z")
+    @pytest.mark.parametrize(
+        "batch_size,n_adds,expected_batches,expected_buffered",
+        [
+            (3, 2, 0, 2),  # below batch_size: nothing written yet
+            (3, 3, 1, 0),  # reaching batch_size flushes
+            (3, 7, 2, 1),  # flushes every batch_size adds, remainder stays buffered
+        ],
+    )
+    def test_auto_flush_at_batch_size(
+        self, make_job_listing, mock_db, mock_conn, mock_scraper,
+        batch_size, n_adds, expected_batches, expected_buffered,
+    ):
+        """Buffer automatically flushes each time batch_size is reached"""
+        mock_scraper.transform_to_job_model.side_effect = (
+            lambda job_data: make_job_listing(job_data.get("id", "unknown"))
+        )
+        mock_db.upsert_jobs_batch.side_effect = lambda conn, jobs: len(jobs)
 
-        # Buffer should be empty after auto-flush
-        assert writer.get_buffer_size() == 0
-        assert writer.stats.batches_written == 1
-        assert writer.stats.total_written == 3
-        mock_db.upsert_jobs_batch.assert_called_once()
+        writer = BatchWriter(mock_conn, mock_scraper, batch_size=batch_size)
+        for n in range(1, n_adds + 1):
+            writer.add_job({"id": f"job-{n:03d}"}, "2024-01-15T10:30:00Z")
+
+        assert writer.get_buffer_size() == expected_buffered
+        assert writer.stats.batches_written == expected_batches
+        assert writer.stats.total_written == expected_batches * batch_size
+        assert mock_db.upsert_jobs_batch.call_count == expected_batches
 
 
 class TestBatchWriterFallback:
     """Tests for fallback to individual inserts on batch failure"""
 
-    @patch('shared.batch_writer.db')
-    def test_fallback_to_individual_inserts_on_batch_error(self, mock_db):
+    def test_fallback_to_individual_inserts_on_batch_error(self, make_job_listing, mock_db, mock_conn, mock_scraper):
         """Falls back to individual inserts when batch fails"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-        job = JobListing(
-            id="job-001",
-            title="Test Job",
-            company="test",
-            location="Test",
-            url="https://test.com",
-            source_id="test",
-            details={},
-            created_at="2024-01-15T10:30:00Z",
-            status="OPEN",
-            has_matched=False,
-            ai_metadata={},
-            first_seen_at="2024-01-15T10:30:00Z",
-            last_seen_at="2024-01-15T10:30:00Z",
-            consecutive_misses=0,
-            details_scraped=False
-        )
+        job = make_job_listing("job-001")
         mock_scraper.transform_to_job_model.return_value = job
 
         # Batch insert fails
@@ -383,32 +239,11 @@ class TestBatchWriterFallback:
         assert writer.stats.errors == 1  # Batch error counted
         assert writer.stats.total_written == 1
 
-    @patch('shared.batch_writer.db')
-    def test_fallback_counts_individual_errors(self, mock_db):
+    def test_fallback_counts_individual_errors(self, make_job_listing, mock_db, mock_conn, mock_scraper):
         """Errors in individual fallback inserts are counted"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-
-        def create_job(job_data):
-            return JobListing(
-                id=job_data.get("id", "unknown"),
-                title="Test Job",
-                company="test",
-                location="Test",
-                url="https://test.com",
-                source_id="test",
-                details={},
-                created_at="2024-01-15T10:30:00Z",
-                status="OPEN",
-                has_matched=False,
-                ai_metadata={},
-                first_seen_at="2024-01-15T10:30:00Z",
-                last_seen_at="2024-01-15T10:30:00Z",
-                consecutive_misses=0,
-                details_scraped=False
-            )
-
-        mock_scraper.transform_to_job_model.side_effect = create_job
+        mock_scraper.transform_to_job_model.side_effect = (
+            lambda job_data: make_job_listing(job_data.get("id", "unknown"))
+        )
 
         # Batch fails
         mock_db.upsert_jobs_batch.side_effect = Exception("Batch failed")
@@ -429,38 +264,16 @@ class TestBatchWriterFallback:
 class TestBatchWriterBufferSize:
     """Tests for get_buffer_size method"""
 
-    def test_get_buffer_size_empty(self):
+    def test_get_buffer_size_empty(self, mock_conn, mock_scraper):
         """Returns 0 for empty buffer"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
         writer = BatchWriter(mock_conn, mock_scraper)
         assert writer.get_buffer_size() == 0
 
-    def test_get_buffer_size_after_adds(self):
+    def test_get_buffer_size_after_adds(self, make_job_listing, mock_conn, mock_scraper):
         """Returns correct count after adding jobs"""
-        mock_conn = MagicMock()
-        mock_scraper = MagicMock()
-
-        def create_job(job_data):
-            return JobListing(
-                id=job_data.get("id", "unknown"),
-                title="Test Job",
-                company="test",
-                location="Test",
-                url="https://test.com",
-                source_id="test",
-                details={},
-                created_at="2024-01-15T10:30:00Z",
-                status="OPEN",
-                has_matched=False,
-                ai_metadata={},
-                first_seen_at="2024-01-15T10:30:00Z",
-                last_seen_at="2024-01-15T10:30:00Z",
-                consecutive_misses=0,
-                details_scraped=False
-            )
-
-        mock_scraper.transform_to_job_model.side_effect = create_job
+        mock_scraper.transform_to_job_model.side_effect = (
+            lambda job_data: make_job_listing(job_data.get("id", "unknown"))
+        )
 
         writer = BatchWriter(mock_conn, mock_scraper, batch_size=100)
         writer.add_job({"id": "job-001"}, "2024-01-15T10:30:00Z")
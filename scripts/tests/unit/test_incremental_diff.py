@@ -4,10 +4,6 @@ Unit tests for calculate_job_diff and evaluate_safety_guard (shared/incremental.
 
 import pytest
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from shared.incremental import (
     SAFETY_GUARD_RATIO,
     SCRAPER_GUARD_DEFAULTS,
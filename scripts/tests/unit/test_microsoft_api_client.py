@@ -4,12 +4,8 @@ Unit tests for Microsoft Jobs API client functions (microsoft_jobs_scraper/api_c
 
 import asyncio
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from microsoft_jobs_scraper import api_client as ms_api_client
 from microsoft_jobs_scraper.api_client import (
     parse_qualifications,
@@ -18,6 +14,7 @@ from microsoft_jobs_scraper.api_client import (
     fetch_job_details,
     fetch_search_results,
     JobDetailsFetchError,
+    JobDetailsTransientError,
     JobSearchError,
     _parse_position_from_search,
     _parse_details_response,
@@ -374,13 +371,23 @@ class TestFetchJobDetails:
             await fetch_job_details(mock_playwright_page, "nonexistent")
 
         assert "nonexistent" in str(exc_info.value)
+        # A 404 will not clear on retry
+        assert not isinstance(exc_info.value, JobDetailsTransientError)
+
+    @pytest.mark.asyncio
+    async def test_fetch_job_details_server_error_is_transient(self, mock_playwright_page):
+        """Raises JobDetailsTransientError on HTTP 5xx"""
+        mock_playwright_page.evaluate = AsyncMock(side_effect=Exception("HTTP 503"))
+
+        with pytest.raises(JobDetailsTransientError):
+            await fetch_job_details(mock_playwright_page, "1234567890")
 
     @pytest.mark.asyncio
     async def test_fetch_job_details_rate_limited(self, mock_playwright_page):
-        """Raises JobDetailsFetchError on rate limiting"""
+        """Raises JobDetailsTransientError on rate limiting"""
         mock_playwright_page.evaluate = AsyncMock(side_effect=Exception("HTTP 429"))
 
-        with pytest.raises(JobDetailsFetchError) as exc_info:
+        with pytest.raises(JobDetailsTransientError) as exc_info:
             await fetch_job_details(mock_playwright_page, "1234567890")
 
         assert "429" in str(exc_info.value)
@@ -423,7 +430,7 @@ class TestFetchJobDetails:
     @pytest.mark.asyncio
     async def test_fetch_job_details_outer_timeout_raises_fetch_error(self, mock_playwright_page):
         """Mirrors the Apple test — pin that an outer asyncio.wait_for
-        timeout surfaces as JobDetailsFetchError, not raw asyncio.TimeoutError.
+        timeout surfaces as JobDetailsTransientError, not raw asyncio.TimeoutError.
         Without this bound, an Eightfold edge slowdown would hang the
         scraper subprocess until SCRAPER_TIMEOUT_MINUTES.
         """
@@ -433,7 +440,7 @@ class TestFetchJobDetails:
         mock_playwright_page.evaluate = _hang_forever
 
         with patch.object(ms_api_client, "_FETCH_OUTER_TIMEOUT_S", 0.05):
-            with pytest.raises(JobDetailsFetchError) as exc_info:
+            with pytest.raises(JobDetailsTransientError) as exc_info:
                 await fetch_job_details(mock_playwright_page, "1970393556642428")
 
         msg = str(exc_info.value).lower()
@@ -3,12 +3,8 @@ Unit tests for Microsoft Jobs parser functions (microsoft_jobs_scraper/parser.py
 """
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from microsoft_jobs_scraper.parser import (
     extract_position_id_from_url,
     extract_job_cards_from_list,
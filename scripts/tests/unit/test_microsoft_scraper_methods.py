@@ -5,13 +5,9 @@ Tests _normalize_posted_date(), _random_delay(), and other utility methods.
 """
 
 import pytest
-import sys
-from pathlib import Path
 from unittest.mock import AsyncMock, patch
 from datetime import datetime, timezone
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from microsoft_jobs_scraper.scraper import MicrosoftJobsScraper
 
 
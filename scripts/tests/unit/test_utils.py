@@ -1,76 +1,76 @@
 """
-Unit tests for utility functions (google_jobs_scraper/utils.py)
+Unit tests for utility functions (google_jobs_scraper/utils.py, shared/utils.py)
 """
 
 import pytest
 import re
 from datetime import datetime
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from google_jobs_scraper.utils import (
-    should_include_job,
     extract_job_id_from_url,
     get_iso_timestamp
 )
+from shared.utils import compile_title_filter
 
 
-class TestShouldIncludeJob:
-    """Tests for should_include_job function"""
-
-    @pytest.fixture
-    def include_keywords(self):
-        return ["software", "engineer", "developer", "data"]
+class TestCompileTitleFilter:
+    """Tests for compile_title_filter function"""
 
     @pytest.fixture
-    def exclude_keywords(self):
-        return ["recruiter", "sales", "manager", "intern"]
+    def should_include_job(self):
+        return compile_title_filter(
+            ["software", "engineer", "developer", "data"],
+            ["recruiter", "sales", "manager", "intern"],
+        )
 
-    def test_should_include_job_matches_include(self, include_keywords, exclude_keywords):
+    def test_should_include_job_matches_include(self, should_include_job):
         """Title with include keyword returns True"""
-        assert should_include_job("Software Engineer", include_keywords, exclude_keywords) is True
-        assert should_include_job("Data Scientist", include_keywords, exclude_keywords) is True
-        assert should_include_job("Senior Developer", include_keywords, exclude_keywords) is True
+        assert should_include_job("Software Engineer") is True
+        assert should_include_job("Data Scientist") is True
+        assert should_include_job("Senior Developer") is True
 
-    def test_should_include_job_matches_exclude(self, include_keywords, exclude_keywords):
+    def test_should_include_job_matches_exclude(self, should_include_job):
         """Title with exclude keyword returns False"""
-        assert should_include_job("Technical Recruiter", include_keywords, exclude_keywords) is False
-        assert should_include_job("Sales Engineer", include_keywords, exclude_keywords) is False
-        assert should_include_job("Engineering Manager", include_keywords, exclude_keywords) is False
+        assert should_include_job("Technical Recruiter") is False
+        assert should_include_job("Sales Engineer") is False
+        assert should_include_job("Engineering Manager") is False
 
-    def test_should_include_job_exclude_takes_priority(self, include_keywords, exclude_keywords):
+    def test_should_include_job_exclude_takes_priority(self, should_include_job):
         """Exclude wins over include when both match"""
         # "Software Recruiter" has both "software" (include) and "recruiter" (exclude)
         # Exclude should win
-        assert should_include_job("Software Recruiter", include_keywords, exclude_keywords) is False
-        assert should_include_job("Sales Software Developer", include_keywords, exclude_keywords) is False
+        assert should_include_job("Software Recruiter") is False
+        assert should_include_job("Sales Software Developer") is False
 
-    def test_should_include_job_no_match(self, include_keywords, exclude_keywords):
+    def test_should_include_job_no_match(self, should_include_job):
         """No matching keywords returns False"""
-        assert should_include_job("Product Designer", include_keywords, exclude_keywords) is False
-        assert should_include_job("Marketing Analyst", include_keywords, exclude_keywords) is False
+        assert should_include_job("Product Designer") is False
+        assert should_include_job("Marketing Analyst") is False
 
-    def test_should_include_job_case_insensitive(self, include_keywords, exclude_keywords):
+    def test_should_include_job_case_insensitive(self, should_include_job):
         """Keywords match case-insensitively"""
-        assert should_include_job("SOFTWARE ENGINEER", include_keywords, exclude_keywords) is True
-        assert should_include_job("software engineer", include_keywords, exclude_keywords) is True
-        assert should_include_job("SoFtWaRe EnGiNeEr", include_keywords, exclude_keywords) is True
+        assert should_include_job("SOFTWARE ENGINEER") is True
+        assert should_include_job("software engineer") is True
+        assert should_include_job("SoFtWaRe EnGiNeEr") is True
 
-        assert should_include_job("RECRUITER", include_keywords, exclude_keywords) is False
-        assert should_include_job("INTERN", include_keywords, exclude_keywords) is False
+        assert should_include_job("RECRUITER") is False
+        assert should_include_job("INTERN") is False
 
-    def test_should_include_job_empty_title(self, include_keywords, exclude_keywords):
+    def test_should_include_job_empty_title(self, should_include_job):
         """Empty title returns False"""
-        assert should_include_job("", include_keywords, exclude_keywords) is False
+        assert should_include_job("") is False
 
-    def test_should_include_job_partial_match(self, include_keywords, exclude_keywords):
+    def test_should_include_job_partial_match(self, should_include_job):
         """Partial keyword matches work (substring matching)"""
         # "software" is in "software-engineer"
-        assert should_include_job("software-engineer-iii", include_keywords, exclude_keywords) is True
+        assert should_include_job("software-engineer-iii") is True
         # "developer" is in "developers"
-        assert should_include_job("Android Developers Team Lead", include_keywords, exclude_keywords) is True
+        assert should_include_job("Android Developers Team Lead") is True
+
+    def test_empty_keyword_lists_never_match(self):
+        """An empty include list matches nothing; an empty exclude list excludes nothing"""
+        assert compile_title_filter([], [])("Software Engineer") is False
+        assert compile_title_filter(["engineer"], [])("Software Engineer") is True
 
 
 class TestExtractJobIdFromUrl: